@@ -0,0 +1,153 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import os
+import csv
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Scripts.Problems import Problems, Drops
+
+def Jobs(regions, sizes, holes = (False, True), problem = 'Example_2', t = 1000, lam = 0.75):
+    """
+    Jobs
+    Function to build the list of jobs of a sweep over regions, sizes and geometries.
+
+    Input:
+        regions                     list            Names of the regions.
+        sizes                       list            Sizes of the clouds.
+        holes                       list            Geometries to be used (False for Clouds, True for Holes).
+        problem                     string          Name of the problem in Problems (Default: 'Example_2').
+        t                           int             Number of time steps to be considered (Default: 1000).
+        lam                         float           Lambda parameter for the implicit scheme (Default: 0.75).
+
+    Output:
+        jobs                        list            List of dictionaries with the parameters of each job.
+    """
+    jobs = []
+    for hol in holes:                                                               # For each geometry.
+        for reg in regions:                                                         # For each region.
+            for me in sizes:                                                        # For each size.
+                jobs.append({'region': reg, 'size': me, 'holes': hol, 'problem': problem, 't': t, 'lam': lam})
+    return jobs
+
+def Run(job):
+    """
+    Run
+    Function to run a single job: the cloud is loaded, the wave equation is solved and the error is computed.
+
+    Input:
+        job                         dict            Parameters of the job (region, size, holes, problem, t, lam).
+                                                    The wave coefficient c can be given to replace the one of the problem.
+
+    Output:
+        row                         dict            Parameters of the job with the number of nodes, the timings and the
+                                                    mean and last quadratic mean errors.
+    """
+    import Scripts.Errors as Errors
+    import Scripts.Storage as Storage
+    import Wave_2D
+
+    f, g, c, cho = Problems[job['problem']]                                         # Definition of the problem.
+    c     = job.get('c', c)                                                         # Wave coefficient.
+    r     = np.array(Drops.get(job['region'], [0, 0]))                              # Initial drop.
+    folder = 'Data/Holes/' if job['holes'] else 'Data/Clouds/'                      # Folder of the data.
+
+    start = time.time()
+    file  = folder + job['region'] + '_' + str(job['size']) + '.mat'                # Name of the file.
+    p, tt, vec = Storage.Read(file)                                                 # Binary format, if it was converted.
+    t_load = time.time() - start
+
+    start = time.time()
+    u_ap, u_ex, vec = Wave_2D.Cloud(p, f, g, job['t'], c, cho, r, implicit=True, triangulation=True, tt=tt, lam=job['lam'], vec=vec)
+    t_solve = time.time() - start
+
+    start = time.time()
+    er    = Errors.Cloud(p, vec, u_ap, u_ex)                                        # The error is computed.
+    t_err = time.time() - start
+
+    row = dict(job)
+    row.update({'c': c, 'nodes': len(p[:,0]), 'load': t_load, 'solve': t_solve, 'error': t_err, \
+                'er_mean': er.mean(), 'er_last': er[-1]})
+    return row
+
+def Sweep(jobs, workers = None, threads = 1):
+    """
+    Sweep
+    Function to run a list of jobs in a pool of processes.
+    The number of BLAS threads of each worker is limited, so the workers do not compete for the cores.
+
+    Input:
+        jobs                        list            List of jobs built with Jobs.
+        workers                     int             Number of worker processes (Default: None, the number of cores).
+        threads                     int             Number of BLAS threads of each worker (Default: 1).
+
+    Output:
+        rows                        list            List with the results of each job, in the order of jobs.
+    """
+    names = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'BLIS_NUM_THREADS', \
+             'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']                       # Variables for the number of threads.
+    saved = {n: os.environ.get(n) for n in names}                                   # The current values are saved.
+    for n in names:                                                                 # For each variable.
+        os.environ[n] = str(threads)                                                # The number of threads is limited.
+
+    try:
+        ctx = multiprocessing.get_context('spawn')                                  # New processes read the limits at start.
+        with ProcessPoolExecutor(max_workers = workers, mp_context = ctx) as pool:
+            rows = list(pool.map(Run, jobs))                                        # The jobs are run.
+    finally:
+        for n in names:                                                             # For each variable.
+            if saved[n] is None:
+                del os.environ[n]                                                   # The variable is removed.
+            else:
+                os.environ[n] = saved[n]                                            # The variable is restored.
+    return rows
+
+def Table(rows, nom = None):
+    """
+    Table
+    Function to print the results of a sweep as a table and, optionally, save them as a CSV file.
+
+    Input:
+        rows                        list            List with the results of each job.
+        nom                         string          Name of the CSV file to be saved to drive (Default: None).
+
+    Output:
+        None
+    """
+    cols = ['region', 'size', 'holes', 'problem', 't', 'lam', 'nodes', 'load', 'solve', 'error', 'er_mean', 'er_last']
+    print(' '.join('%10s' %col for col in cols))
+    for row in rows:
+        print(' '.join('%10.4g' %row[col] if isinstance(row[col], float) else '%10s' %row[col] for col in cols))
+
+    if nom is not None:
+        with open(nom, 'w', newline = '') as fid:
+            writer = csv.DictWriter(fid, fieldnames = cols, extrasaction = 'ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+
+if __name__ == '__main__':
+    # Nightly sweep over all the regions, sizes and geometries.
+    regions = ['CAB', 'CUA', 'CUI', 'DOW', 'ENG', 'GIB', 'HAB', 'MIC', 'PAT', 'ZIR']
+    sizes   = [1, 2, 3]
+
+    start = time.time()
+    rows  = Sweep(Jobs(regions, sizes))
+    Table(rows, 'Results/Sweep.csv')
+    print('The elapsed time of the sweep was: ', time.time() - start, 'seconds.')
@@ -17,11 +17,8 @@ Last Modification:
 """
 
 import numpy as np
-from scipy.io import loadmat
-from scipy.io import savemat
-import Scripts.Graph as Graph
-import Scripts.Errors as Errors
-import Wave_2D
+import Scripts.Convergence as Convergence
+import Scripts.Storage as Storage
 
 # Wave coefficient
 c = 1
@@ -34,11 +31,9 @@ regions = ['CUA','ENG','HAB','PAT']
 
 # Sizes of the clouds
 sizes = [1, 2, 3, 4]
-#sizes = [2]
 
 # Times
-times = [1]
-#times = [1, 2, 3, 4]
+times = [100, 200, 300, 400]
 
 # Boundary conditions
 # The boundary conditions are defined as
@@ -55,37 +50,23 @@ def gWAV(x, y, t, c, cho, r):
     fun = 0
     return fun
 
-for reg in regions:
-    regi = reg
-    print('Region:', regi)
-
-    r = np.array([0, 0])
-    
-    for me in sizes:
-        cloud = str(me)
-
-        for ti in times:
-            if ti == 1:
-                t = 100
-            if ti == 2:
-                t = 200
-            if ti == 3:
-                t = 300
-            if ti == 4:
-                t = 400
-        
-            # All data is loaded from the file
-            mat = loadmat('Data/Clouds/' + regi + '_' + cloud + '_n.mat')
-
-            # Node data is saved
-            p   = mat['p']
-            tt  = mat['tt']
-            if tt.min() == 1:
-                tt -= 1
-        
-            # Wave Equation in 2D computed on a unstructured cloud of points.
-            u_ap, u_ex, vec = Wave_2D.Cloud(p, fWAV, gWAV, t, c, cho, r, implicit=True, triangulation=True, tt=tt, lam=0.25)
-            er = Errors.Cloud(p, vec, u_ap, u_ex)
-        
-            print('\tThe mean square error with', len(p[:,0]), 'nodes is: ', er.mean())
-            #print('\tThe mean square error with \Delta t = ', 1/t, 'is: ', er.mean())
\ No newline at end of file
+if __name__ == '__main__':
+    for reg in regions:
+        regi = reg
+        print('Region:', regi)
+
+        r = np.array([0, 0])
+
+        # All data is loaded from the files
+        clouds = []
+        for me in sizes:
+            cloud = str(me)
+            clouds.append(Storage.Read('Data/Clouds/' + regi + '_' + cloud + '_n.mat'))
+
+        # Convergence study on unstructured clouds of points.
+        er, h, dt, q = Convergence.Study(clouds, times, fWAV, gWAV, c, cho, r, lam=0.25)
+
+        for i, me in enumerate(sizes):
+            print('\tThe mean square errors with', len(clouds[i][0][:,0]), 'nodes are: ', er[i,:])
+        print('\tThe observed order of convergence in space is: ', q['space'])
+        print('\tThe observed order of convergence in time is: ', q['time'])
@@ -0,0 +1,26 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import time
+import Scripts.Storage as Storage
+
+if __name__ == '__main__':
+    # Conversion of all the clouds on Data to the binary format, with the neighbors of each node.
+    start   = time.time()
+    folders = Storage.Convert_All('Data', vec = True)
+    print('%d clouds converted in %1.2f s.' %(len(folders), time.time() - start))
@@ -0,0 +1,146 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import numpy as np
+import Scripts.Errors as Errors
+import Scripts.Kernels as Kernels
+import Scripts.Storage as Storage
+import Wave_2D
+from Scripts.Problems import Problems
+
+def Check(p, tt, problem, t = 1000, lam = 0.75, vec = None):
+    """
+    Check
+    Function to compare the float32 and float64 solutions of a problem on a cloud of points.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        problem                     string          Name of the problem in Scripts.Problems.
+        t                           int             Number of time steps to be considered (Default: 1000).
+        lam                         float           Lambda parameter for the implicit scheme (Default: 0.75).
+        vec         m x nvec        Array           Neighbors of each node stored with the cloud (Default: None).
+
+    Output:
+        er64                        float           Mean quadratic error of the float64 solution.
+        er32                        float           Mean quadratic error of the float32 solution.
+        dif                         float           Maximum difference between both solutions.
+    """
+    f, g, c, cho = Problems[problem]                                                # Definition of the problem.
+    r   = np.array([0, 0])                                                          # Initial drop.
+    sol = {}                                                                        # Solutions of each precision.
+    for dtype in [np.float64, np.float32]:                                          # For each precision.
+        u_ap, u_ex, vec = Wave_2D.Cloud(p, f, g, t, c, cho, r, implicit=True, triangulation=True, tt=tt, lam=lam, dtype=dtype, vec=vec)
+        sol[dtype] = (u_ap, Errors.Cloud(p, vec, u_ap, u_ex).mean())                # Solution and error.
+    dif = np.max(np.abs(sol[np.float64][0] - sol[np.float32][0]))                   # Maximum difference between both solutions.
+    return sol[np.float64][1], sol[np.float32][1], dif
+
+def Check_Krylov(p, tt, problem, t = 200, lam = 0.75, vec = None, solvers = ('gmres', 'bicgstab')):
+    """
+    Check_Krylov
+    Function to check that the iterative solvers converge with float32 operators and reach the float64 accuracy.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        problem                     string          Name of the problem in Scripts.Problems.
+        t                           int             Number of time steps to be considered (Default: 200).
+        lam                         float           Lambda parameter for the implicit scheme (Default: 0.75).
+        vec         m x nvec        Array           Neighbors of each node stored with the cloud (Default: None).
+        solvers                     tuple           Iterative solvers to be checked (Default: ('gmres', 'bicgstab')).
+
+    Output:
+        rows                        list            (solver, er64, er32, mean iterations with float32) for each solver.
+    """
+    f, g, c, cho = Problems[problem]                                                # Definition of the problem.
+    r    = np.array([0, 0])                                                         # Initial drop.
+    rows = []
+    for solver in solvers:                                                          # For each iterative solver.
+        er, its = {}, []                                                            # Errors and iterations.
+        for dtype in [np.float64, np.float32]:                                      # For each precision.
+            its.clear()
+            u_ap, u_ex, vec = Wave_2D.Cloud(p, f, g, t, c, cho, r, implicit=True, triangulation=True, tt=tt, lam=lam, solver=solver, its=its, dtype=dtype, vec=vec)
+            er[dtype] = Errors.Cloud(p, vec, u_ap, u_ex).mean()                     # Mean error of the precision.
+        if not np.isfinite(er[np.float32]) or er[np.float32] > 2*er[np.float64]:    # If float32 did not converge.
+            raise RuntimeError('The ' + solver + ' solver did not reach the float64 accuracy with float32.')
+        rows.append((solver, er[np.float64], er[np.float32], np.mean(its)))
+    return rows
+
+def Check_Kernels(p, tt, problem, t = 200, vec = None):
+    """
+    Check_Kernels
+    Function to check that the compiled kernels (Numba) give the same Gammas and solution as the NumPy and SciPy path.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        problem                     string          Name of the problem in Scripts.Problems.
+        t                           int             Number of time steps to be considered (Default: 200).
+        vec         m x nvec        Array           Neighbors of each node stored with the cloud (Default: None).
+
+    Output:
+        difK                        float           Maximum difference between the K0 matrices of both paths.
+        difu                        float           Maximum difference between the solutions of both paths.
+                                                    None, None is returned if Numba is not installed.
+    """
+    if not Kernels.Load():                                                          # If Numba is not installed.
+        return None, None
+    f, g, c, cho = Problems[problem]                                                # Definition of the problem.
+    r   = np.array([0, 0])                                                          # Initial drop.
+    sol = {}                                                                        # Gammas and solution of each path.
+    try:
+        for numba in [True, False]:                                                 # For the compiled and the NumPy path.
+            Kernels.Numba = numba                                                   # The path is selected.
+            geometry  = Wave_2D.Geometry(p, True, tt, vec = vec)                    # Neighbors and Gammas.
+            u_ap      = Wave_2D.Cloud(p, f, g, t, c, cho, r, triangulation=True, tt=tt, geometry=geometry)[0]
+            sol[numba] = (geometry[1], u_ap)
+    finally:
+        Kernels.Numba = True                                                        # The compiled path is restored.
+    difK = abs(sol[True][0] - sol[False][0]).max()                                  # Difference between the Gammas.
+    difu = np.max(np.abs(sol[True][1] - sol[False][1]))                             # Difference between the solutions.
+    if difK > 1e-10*abs(sol[False][0]).max() or difu > 1e-10*np.max(np.abs(sol[False][1])):
+        raise RuntimeError('The compiled kernels do not match the NumPy path.')
+    return difK, difu
+
+if __name__ == '__main__':
+    p, tt, vec = Storage.Read('Data/Clouds/CAB_1.mat')
+
+    # Compiled kernels against the NumPy path.
+    difK, difu = Check_Kernels(p, tt, 'Example_1', vec = vec)
+    if difK is None:
+        print('Numba is not installed, the compiled kernels were not checked.')
+    else:
+        print('Compiled kernels: %12.4e %12.4e' %(difK, difu))
+
+    # Convergence of the iterative solvers with float32 operators.
+    for solver, er64, er32, its in Check_Krylov(p, tt, 'Example_2', vec = vec):
+        print('%10s %12.4e %12.4e %8.2f' %(solver, er64, er32, its))
+
+    # Accuracy loss of float32 against float64 for Example 1 and Example 2.
+    regions = ['CAB', 'CUA', 'CUI', 'DOW', 'ENG', 'GIB', 'HAB', 'MIC', 'PAT', 'ZIR']
+    sizes   = [1, 2, 3]
+
+    print('%10s %10s %6s %6s %12s %12s %12s %12s' %('problem', 'region', 'size', 'holes', 'er64', 'er32', 'loss', 'max_dif'))
+    for problem in ['Example_1', 'Example_2']:
+        for hol in [False, True]:
+            for reg in regions:
+                for me in sizes:
+                    folder = 'Data/Holes/' if hol else 'Data/Clouds/'
+                    p, tt, vec = Storage.Read(folder + reg + '_' + str(me) + '.mat')
+                    er64, er32, dif = Check(p, tt, problem, vec = vec)
+                    print('%10s %10s %6d %6s %12.4e %12.4e %12.4e %12.4e' %(problem, reg, me, hol, er64, er32, (er32 - er64)/er64, dif))
@@ -0,0 +1,129 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import os
+import hashlib
+import numpy as np
+import scipy.sparse as sp
+
+def Key(p, tt, nvec, *opts, vec = None):
+    """
+    Key
+    Function to compute the content-addressed key of the operators of a cloud of points.
+    The key is the SHA-1 hash of the nodes, the triangles, the neighbors given by the caller and the parameters of the
+    scheme.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles (or None).
+        nvec                        integer         Maximum number of neighbors.
+        opts                                        Any other parameter that changes the operators.
+        vec         m x nvec        Array           Neighbors given by the caller (Default: None, they are searched).
+
+    Output:
+        key                         string          Hexadecimal key of the operators.
+    """
+    h = hashlib.sha1()                                                              # Hash initialization.
+    h.update(np.ascontiguousarray(p, dtype=float).tobytes())                        # The nodes are hashed.
+    if tt is not None:                                                              # If there are triangles.
+        h.update(np.ascontiguousarray(tt, dtype=np.int64).tobytes())                # The triangles are hashed.
+    if vec is not None:                                                             # If the neighbors are given.
+        h.update(np.ascontiguousarray(vec, dtype=np.int64).tobytes())               # The neighbors are hashed.
+        h.update(repr(np.shape(vec)).encode())                                      # With their shape.
+    h.update(repr((p.shape, nvec, opts)).encode())                                  # The parameters are hashed.
+    return h.hexdigest()
+
+def Load(folder, key):
+    """
+    Load
+    Function to load the operators of a cloud of points from the cache.
+
+    Input:
+        folder                      string          Folder of the cache.
+        key                         string          Key of the operators.
+
+    Output:
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        K           m x m           Array           K Matrix with the computed Gammas (scipy.sparse.csr_matrix).
+                                                    None, None is returned if the operators are not in the cache.
+    """
+    file = os.path.join(folder, key + '.npz')                                       # Name of the file.
+    if not os.path.exists(file):                                                    # If the operators are not in the cache.
+        return None, None
+    with np.load(file) as data:                                                     # The file is read.
+        vec = data['vec']                                                           # The neighbors are loaded.
+        K   = sp.csr_matrix((data['data'], data['indices'], data['indptr']), \
+                            shape = tuple(data['shape']))                           # K is loaded.
+    os.utime(file)                                                                  # The file is marked as recently used.
+    return vec, K
+
+def Save(folder, key, vec, K, size = 2**30):
+    """
+    Save
+    Function to store the operators of a cloud of points in the cache.
+    After storing them, the least recently used files are removed until the cache is smaller than size.
+
+    Input:
+        folder                      string          Folder of the cache.
+        key                         string          Key of the operators.
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        K           m x m           Array           K Matrix with the computed Gammas (dense or sparse).
+        size                        int             Maximum size of the cache in bytes (Default: 1 GiB).
+
+    Output:
+        None
+    """
+    os.makedirs(folder, exist_ok = True)                                            # The folder is created.
+    K    = sp.csr_matrix(K)                                                         # K is stored in CSR format.
+    file = os.path.join(folder, key + '.npz')                                       # Name of the file.
+    temp = os.path.join(folder, key + '.' + str(os.getpid()) + '.tmp')             # Temporal name of the file.
+    with open(temp, 'wb') as fid:                                                   # The operators are written.
+        np.savez(fid, vec = vec, data = K.data, indices = K.indices, indptr = K.indptr, shape = np.array(K.shape))
+    os.replace(temp, file)                                                          # The file is stored at once.
+    Evict(folder, size)                                                             # The cache is kept under its size.
+
+def Evict(folder, size):
+    """
+    Evict
+    Function to remove the least recently used files of the cache until it is smaller than size.
+
+    Input:
+        folder                      string          Folder of the cache.
+        size                        int             Maximum size of the cache in bytes.
+
+    Output:
+        None
+    """
+    files = []                                                                      # Files of the cache.
+    for f in os.listdir(folder):                                                    # For each file in the folder.
+        if f.endswith('.npz'):                                                      # If it stores some operators.
+            try:
+                info = os.stat(os.path.join(folder, f))                             # Size and time of last use.
+            except FileNotFoundError:                                               # If it was removed by another process.
+                continue
+            files.append((info.st_mtime, info.st_size, os.path.join(folder, f)))
+    files = sorted(files)                                                           # Files sorted from the oldest use.
+    total = sum(f[1] for f in files)                                                # Total size of the cache.
+    for _, fsize, f in files:                                                       # For each file, from the oldest use.
+        if total <= size:                                                           # If the cache is small enough.
+            break
+        total -= fsize                                                              # The size of the file is released.
+        try:
+            os.remove(f)                                                            # The file is removed.
+        except FileNotFoundError:                                                   # If it was removed by another process.
+            pass
@@ -0,0 +1,116 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import Scripts.Errors as Errors
+import Wave_2D
+
+def Spacing(p, vec):
+    """
+    Spacing
+    Function to compute the characteristic spacing h of a cloud of points as the mean distance between neighbor nodes.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+
+    Output:
+        h                           float           Mean distance between neighbor nodes.
+    """
+    mask = vec != -1                                                                # Mask with the existing neighbors.
+    dx   = p[vec,0] - p[:,0,np.newaxis]                                             # dx is computed.
+    dy   = p[vec,1] - p[:,1,np.newaxis]                                             # dy is computed.
+    return np.sqrt(dx**2 + dy**2)[mask].mean()
+
+def Order(h, er):
+    """
+    Order
+    Function to fit the observed order of convergence q of er = C h^q with a least-squares fit in logarithmic scale.
+
+    Input:
+        h           n x 1           Array           Spacings (or time steps) of the refinements.
+        er          n x 1           Array           Errors of the refinements.
+
+    Output:
+        q                           float           Observed order of convergence.
+    """
+    return np.polyfit(np.log(h), np.log(er), 1)[0]
+
+def Run(job):
+    """
+    Run
+    Function to solve one refinement of the study reusing the geometry of the cloud, and compute its mean error.
+
+    Input:
+        job                         tuple           (p, geometry, f, g, t, c, cho, r, lam) of the refinement.
+
+    Output:
+        er                          float           Mean of the quadratic mean error over all the time steps.
+    """
+    p, geometry, f, g, t, c, cho, r, lam = job
+    u_ap, u_ex, vec = Wave_2D.Cloud(p, f, g, t, c, cho, r, implicit=True, lam=lam, geometry=geometry)
+    return Errors.Cloud(p, vec, u_ap, u_ex).mean()
+
+def Study(clouds, times, f, g, c, cho, r, lam = 0.5, workers = None):
+    """
+    Study
+    Function to perform a convergence study over several clouds of points and numbers of time steps.
+    The neighbors and the Gammas of each cloud, which do not depend on the time step, are computed only once and rescaled
+    by c^2 dt^2 for each refinement. The refinements are solved in parallel, and the observed orders of convergence in
+    space (with the finest time step) and in time (with the finest cloud) are fitted automatically.
+
+    Input:
+        clouds                      list            List of tuples (p, tt) or (p, tt, vec) with the nodes, triangles and
+                                                    neighbors of each cloud, as returned by Storage.Read, from the
+                                                    coarsest to the finest one (tt and vec can be None).
+        times                       list            Numbers of time steps, from the coarsest to the finest one.
+        f                           function        Function declared with the boundary condition.
+        g                           function        Function declared with the boundary condition.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+        r           1 x 2           Array           Coordinates of the water drop-like function.
+        lam                         float           Lambda parameter for the implicit scheme (Default: 0.5).
+        workers                     int             Number of worker processes (Default: None, the number of cores).
+                                                    With workers = 1 the refinements are solved serially.
+
+    Output:
+        er          n x s           Array           Mean errors for each cloud (rows) and number of time steps (columns).
+        h           n x 1           Array           Spacing of each cloud.
+        dt          s x 1           Array           Time step of each number of time steps.
+        q                           dict            Observed orders of convergence in 'space' and 'time'.
+    """
+    geom = [Wave_2D.Geometry(p, tt is not None, tt, vec = (nv[0] if nv else None)) \
+            for p, tt, *nv in clouds]                                               # Geometry of each cloud, computed once.
+    h    = np.array([Spacing(cl[0], v) for cl, (v, _) in zip(clouds, geom)])        # Spacing of each cloud.
+    dt   = np.array([1/(t-1) for t in times])                                       # Time step of each refinement.
+    jobs = [(cl[0], G, f, g, t, c, cho, r, lam) for cl, G in zip(clouds, geom) for t in times]
+
+    if workers == 1:                                                                # If the refinements are solved serially.
+        er = [Run(job) for job in jobs]
+    else:                                                                           # If the refinements are solved in parallel.
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            er = list(pool.map(Run, jobs))
+    er = np.array(er).reshape(len(clouds), len(times))                              # Errors for each cloud and time step.
+
+    q  = {'space': np.nan, 'time': np.nan}                                          # Observed orders of convergence.
+    if len(clouds) > 1:                                                             # If there are several clouds.
+        q['space'] = Order(h, er[:,-1])                                             # Order in space with the finest time step.
+    if len(times) > 1:                                                              # If there are several time steps.
+        q['time']  = Order(dt, er[-1,:])                                            # Order in time with the finest cloud.
+    return er, h, dt, q
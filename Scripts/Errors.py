@@ -34,6 +34,77 @@ def PolyArea(x,y):
 
     return area
 
+def Mesh_Area(x, y):
+    """
+    Mesh_Area
+    Function to compute, for all the inner nodes of a logically rectangular mesh at once, the area of the polygon defined by
+    the eight immediate neighbors of the node, with the shoelace formula.
+
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+
+    Output:
+        area        m x n           Array           Area of each node (zero for the boundary nodes).
+    """
+    m, n = x.shape                                                                  # The size of the region.
+    area = np.zeros([m,n])                                                          # area initialization with zeros.
+    ring = [(2,1), (2,2), (1,2), (0,2), (0,1), (0,0), (1,0), (2,0)]                 # Offsets of the vertices of the polygon.
+    px   = np.stack([x[a:m-2+a, b:n-2+b] for a, b in ring])                         # The x-values of the polygons are stored.
+    py   = np.stack([y[a:m-2+a, b:n-2+b] for a, b in ring])                         # The y-values of the polygons are stored.
+    area[1:-1,1:-1] = 0.5*np.abs(np.sum(px*np.roll(py, 1, axis = 0) - \
+                                        py*np.roll(px, 1, axis = 0), axis = 0))     # Area computation.
+    return area
+
+def Cloud_Area(p, vec):
+    """
+    Cloud_Area
+    Function to compute, for all the nodes of a cloud at once, the area of the polygon defined by their neighbors, with a
+    batched shoelace formula over the padded vec array. The missing neighbors are replaced by the last existing one, which
+    adds only zero terms to the formula.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+
+    Output:
+        area        m x 1           Array           Area of each node.
+    """
+    m     = p.shape[0]                                                              # The size of the region.
+    vec   = np.asarray(vec, dtype=int)                                              # Indices of the neighbors.
+    nvec  = np.sum(vec != -1, axis = 1)                                             # The number of neighbors of each node.
+    last  = vec[np.arange(m), np.maximum(nvec - 1, 0)]                              # The last neighbor of each node.
+    last  = np.where(nvec > 0, last, np.arange(m))                                  # Nodes without neighbors use themselves.
+    index = np.where(vec != -1, vec, last[:,np.newaxis])                            # Padded indices of the neighbors.
+    polix = p[index, 0]                                                             # The x-values of the polygons are stored.
+    poliy = p[index, 1]                                                             # The y-values of the polygons are stored.
+    area  = 0.5*np.abs(np.sum(polix*np.roll(poliy, 1, axis = 1) - \
+                              poliy*np.roll(polix, 1, axis = 1), axis = 1))         # Area computation.
+    return area
+
+def Norm(u_ap, u_ex, weight, chunk = 256):
+    """
+    Norm
+    Function to compute the weighted quadratic mean error of all the time levels at once.
+    The time levels are processed by blocks of chunk columns, so memory-mapped histories can be used.
+
+    Input:
+        u_ap        m x t           Array           Array with the computed solution.
+        u_ex        m x t           Array           Array with the theoretical solution.
+        weight      m x 1           Array           Weight of each node.
+        chunk                       int             Number of time levels processed at once (Default: 256).
+
+    Output:
+        er          t x 1           Array           Mean square error computed on each time step.
+    """
+    t  = u_ap.shape[1]                                                              # The number of time steps.
+    er = np.zeros(t)                                                                # er initialization with zeros.
+    w  = np.broadcast_to(weight, (u_ap.shape[0],))[:,np.newaxis]                    # Weights as a column.
+    for k in np.arange(0, t, chunk):                                                # For each block of time steps.
+        d = np.asarray(u_ap[:, k:k+chunk], dtype = float) - u_ex[:, k:k+chunk]      # Difference between both solutions.
+        er[k:k+chunk] = np.sqrt(np.mean(np.square(d)*w, axis = 0))                  # Mean square error computation.
+    return er
+
 def Mesh(x, y, u_ap, u_ex):
     """
     Mesh_Transient
@@ -49,20 +120,9 @@ def Mesh(x, y, u_ap, u_ex):
     Output:
         er          t x 1           Array           Mean square error computed on each time step.
     """
-    m, n, t = x.shape[0], x.shape[1], u_ap.shape[2]                                 # The size of the region.
-    er      = np.zeros(t)                                                           # er initialization with zeros.
-    area    = np.zeros([m,n])                                                       # area initialization with zeros.
-
-    for i in np.arange(1,m-1):                                                      # For each of the nodes on the x axis.
-        for j in np.arange(1,n-1):                                                  # For each of the nodes on the y axis.
-            px = x[i-1:i+2, j-1:j+2].flatten()                                      # The x-values of the polygon are stored.
-            py = y[i-1:i+2, j-1:j+2].flatten()                                      # The y-values of the polygon are stored.
-            area[i,j] = PolyArea(px,py)                                             # Area computation.
-
-    for k in np.arange(t):                                                          # For each time step.
-        err = np.square(u_ap[:,:,k] - u_ex[:,:,k])*area                             # Mean square error computation.
-        er[k] = np.sqrt(err)                                                        # The square root is computed.
-    
+    area = Mesh_Area(x, y)                                                          # Area of each node.
+    err  = np.square(np.asarray(u_ap, dtype = float) - u_ex)*area[:,:,np.newaxis]   # Mean square error computation.
+    er   = np.sqrt(np.sum(err, axis = (0,1)))                                       # The square root is computed.
     return er
 
 def Cloud(p, vec, u_ap, u_ex):
@@ -80,24 +140,8 @@ def Cloud(p, vec, u_ap, u_ex):
     Output:
         er          t x 1           Array           Mean square error computed on each time step.
     """
-
-    m, t = p.shape[0], u_ap.shape[1]                                                # The size of the region.
-    er   = np.zeros(t)                                                              # er initialization with zeros.
-    area = np.zeros(m)                                                              # area initialization with zeros.
-
-    for i in np.arange(m):
-        nvec = sum(vec[i,:] != -1)                                                  # The number of neighbors of the central node.
-        polix = np.zeros([nvec])                                                    # The x-values of the polygon are stored.
-        poliy = np.zeros([nvec])                                                    # The y-values of the polygon are stored.
-        nindex = vec[i, :nvec].astype(int)                                          # Indices of the neighbors.
-        polix[:] = p[nindex, 0]                                                     # The x coordinate of the node is stored.
-        poliy[:] = p[nindex, 1]                                                     # The y coordinate of the node is stored.
-        area[i] = PolyArea(polix, poliy)                                            # Area computation.
-
-    for k in np.arange(t):                                                          # For each time step.
-        err = np.square(u_ap[:, k] - u_ex[:, k])*area                               # Mean square error computation.
-        er[k] = np.sqrt(np.mean(err))                                               # The square root is computed.
-    
+    area = Cloud_Area(p, vec)                                                       # Area of each node.
+    er   = Norm(u_ap, u_ex, area)                                                   # Mean square error computation.
     return er
 
 def Cloud_size(p, u_ap, u_ex):
@@ -107,23 +151,54 @@ def Cloud_size(p, u_ap, u_ex):
     
     Input:
         p           m x 2           Array           Array with the coordinates of the nodes.
-        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
         u_ap        m x t           Array           Array with the computed solution.
         u_ex        m x t           Array           Array with the theoretical solution.
     
     Output:
         er          t x 1           Array           Mean square error computed on each time step.
     """
+    m    = p.shape[0]                                                               # The size of the region.
+    er   = Norm(u_ap, u_ex, 1/m)                                                    # Mean square error computation.
+    return er
 
-    m, t = p.shape[0], u_ap.shape[1]                                                # The size of the region.
-    er   = np.zeros(t)                                                              # er initialization with zeros.
-    area = 1/m                                                                      # "area" would be computed with the size.
+def Reducer(name, p, vec = None):
+    """
+    Reducer
+    Function to build an error reducer, which computes the error of a single time step, so the error curve can be
+    accumulated while the solution is computed, without storing the full histories.
 
-    for k in np.arange(t):                                                          # For each time step.
-        err = np.square(u_ap[:, k] - u_ex[:, k])*area                               # Mean square error computation.
-        er[k] = np.sqrt(np.mean(err))                                               # The square root is computed.
-    
-    return er
+    Input:
+        name                        string          Error to be computed.
+                                                        'cloud': Area-weighted quadratic mean error, as Cloud.
+                                                        'size': Size-weighted quadratic mean error, as Cloud_size.
+                                                        'max': Maximum absolute error.
+                                                    A function reduce(u_ap, u_ex) can also be given.
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+                                                    Only required for 'cloud'.
+
+    Output:
+        reduce                      function        Function that receives u_ap and u_ex of a time step (m x 1) and
+                                                    returns their error.
+    """
+    if callable(name):                                                              # If the reducer is given.
+        return name
+    m = p.shape[0]                                                                  # The size of the region.
+    if name == 'cloud':                                                             # For the area-weighted error.
+        weight = Cloud_Area(p, vec)                                                 # Area of each node.
+    elif name == 'size':                                                            # For the size-weighted error.
+        weight = np.full(m, 1/m)                                                    # Same weight for all the nodes.
+    elif name == 'max':                                                             # For the maximum error.
+        def reduce(u_ap, u_ex):
+            return np.max(np.abs(np.asarray(u_ap, dtype = float) - u_ex))           # Maximum absolute error.
+        return reduce
+    else:                                                                           # For any other error.
+        raise ValueError('Unknown error reducer: ' + str(name))
+
+    def reduce(u_ap, u_ex):
+        d = np.asarray(u_ap, dtype = float) - u_ex                                  # Difference between both solutions.
+        return np.sqrt(np.mean(np.square(d)*weight))                                # Mean square error computation.
+    return reduce
 
 
 def Mesh_old(x, y, u_ap, u_ex):
@@ -17,17 +17,97 @@ Last Modification:
 """
 
 import numpy as np
+import scipy.sparse as sp
+import Scripts.Kernels as Kernels
 
-def Cloud(p, vec, L):
+def Cloud_Gammas(p, vec, L):
     """
+    2D Clouds of Points Batched Gammas Computation.
+
+    This function computes the Gamma values of all the inner nodes of a cloud of points at once.
+    The offsets to the neighbors are padded with zeros into an m x 5 x nvec stack, so all the local least-squares systems are
+    solved with a single stacked pseudoinverse. The padded columns do not modify the Gammas of the nodes with less than nvec
+    neighbors, and their weights are equal to zero.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        L           5 x 1           Array           Array with the values of the differential operator.
+
+    Output:
+        Gamma       m x nvec+1      Array           Gammas for the central node (first column) and its neighbors.
+    """
+    # Variable initialization
+    m     = len(p[:,0])                                                             # The total number of nodes.
+    nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
+    Gamma = np.zeros([m, nvec+1])                                                   # Gamma initialization with zeros.
+    inne  = np.flatnonzero(p[:,2] == 0)                                             # Indices of the inner nodes.
+    neig  = vec[inne,:]                                                             # Neighbors of the inner nodes.
+    mask  = neig != -1                                                              # Mask with the existing neighbors.
+
+    # Gammas computation
+    dx    = np.where(mask, p[neig,0] - p[inne,0,np.newaxis], 0)                     # dx is computed.
+    dy    = np.where(mask, p[neig,1] - p[inne,1,np.newaxis], 0)                     # dy is computed.
+    M     = np.stack([dx, dy, dx**2, dx*dy, dy**2], axis = 1)                       # M matrices are assembled.
+    YY    = Kernels.Pinv(M, L)                                                      # M^+ L for all the matrices M.
+    Gamma[inne,0]  = -YY.sum(axis = 1)                                              # Gamma values for the central nodes.
+    Gamma[inne,1:] = YY                                                             # Gamma values for the neighbor nodes.
+    return Gamma
+
+def Cloud(p, vec, L, sparse = False, dtype = np.float64):
+    """
+    2D Clouds of Points Gammas Computation.
+     
+    This function computes the Gamma values for clouds of points, and assemble the K matrix for the computations.
+    All the Gammas are computed at once with Cloud_Gammas and scattered into K; boundary nodes keep a row of zeros.
+    When a sparse matrix is requested, K is assembled from (row, column, value) triplets in Compressed Sparse Row format,
+    so that memory and matrix-vector products grow linearly with the number of nodes.
+     
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        sparse                      bool            Select whether or not K is assembled as a sparse matrix.
+                                                        True: K is a scipy.sparse.csr_matrix.
+                                                        False: K is a dense ndarray (Default).
+        dtype                       dtype           Floating point type of K (Default: np.float64). The Gammas are
+                                                    computed in float64 and downcast afterward.
+     
+     Output:
+        K           m x m           Array           K Matrix with the computed Gammas.
+    """
+    # Variable initialization
+    m     = len(p[:,0])                                                             # The total number of nodes.
+    nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
+    Gamma = Cloud_Gammas(p, vec, L).astype(dtype)                                   # Gammas computation.
+
+    # Matrix assembly
+    col   = np.hstack([np.arange(m)[:,np.newaxis], vec])                            # Columns for the central and neighbor nodes.
+    row   = np.repeat(np.arange(m), nvec+1).reshape(m, nvec+1)                      # Rows for the central and neighbor nodes.
+    mask  = (col != -1) & (p[:,2] == 0)[:,np.newaxis]                               # Only the existing neighbors of inner nodes.
+    if sparse == True:                                                              # If a sparse matrix is requested.
+        K = sp.csr_matrix((Gamma[mask], (row[mask], col[mask])), shape = (m, m))    # K is assembled from the triplets.
+    else:                                                                           # If a dense matrix is requested.
+        K = np.zeros([m,m], dtype = dtype)                                          # K initialization with zeros.
+        K[row[mask], col[mask]] = Gamma[mask]                                       # The Gammas are stored in K.
+    return K
+
+def Cloud_old(p, vec, L, sparse = False):
+    """
+    (Outdated working version)
     2D Clouds of Points Gammas Computation.
      
     This function computes the Gamma values for clouds of points, and assemble the K matrix for the computations.
+    When a sparse matrix is requested, the Gammas are collected as (row, column, value) triplets and K is assembled in
+    Compressed Sparse Row format, so that memory and matrix-vector products grow linearly with the number of nodes.
      
     Input:
         p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
         vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
         L           5 x 1           Array           Array with the values of the differential operator.
+        sparse                      bool            Select whether or not K is assembled as a sparse matrix.
+                                                        True: K is a scipy.sparse.csr_matrix.
+                                                        False: K is a dense ndarray (Default).
      
      Output:
         K           m x m           Array           K Matrix with the computed Gammas.
@@ -35,7 +115,12 @@ def Cloud(p, vec, L):
     # Variable initialization
     nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
     m     = len(p[:,0])                                                             # The total number of nodes.
-    K     = np.zeros([m,m])                                                         # K initialization with zeros.
+    if sparse == True:                                                              # If a sparse matrix is requested.
+        row = []                                                                    # Row indices of the nonzero Gammas.
+        col = []                                                                    # Column indices of the nonzero Gammas.
+        val = []                                                                    # Values of the nonzero Gammas.
+    else:                                                                           # If a dense matrix is requested.
+        K   = np.zeros([m,m])                                                       # K initialization with zeros.
     
     # Gammas computation and Matrix assembly
     for i in np.arange(m):                                                          # For each of the nodes.
@@ -51,18 +136,97 @@ def Cloud(p, vec, L):
             M     = np.linalg.pinv(M)                                               # The pseudoinverse of matrix M.
             YY    = M@L                                                             # M*L computation.
             Gamma = np.vstack([-sum(YY), YY]).transpose()                           # Gamma values are found.
-            K[i,i] = Gamma[0,0]                                                     # The corresponding Gamma for the central node.
-            for j in np.arange(nvec):                                               # For each of the neighbor nodes.
-                K[i, vec[i,j]] = Gamma[0,j+1]                                       # The corresponding Gamma for the neighbor node.
+            if sparse == True:                                                      # If a sparse matrix is requested.
+                row.extend([i]*(nvec + 1))                                          # The row of the central node.
+                col.extend([i])                                                     # The column of the central node.
+                col.extend(vec[i, :nvec])                                           # The columns of the neighbor nodes.
+                val.extend(Gamma[0, :])                                             # The Gammas for the central and neighbor nodes.
+            else:                                                                   # If a dense matrix is requested.
+                K[i,i] = Gamma[0,0]                                                 # The corresponding Gamma for the central node.
+                for j in np.arange(nvec):                                           # For each of the neighbor nodes.
+                    K[i, vec[i,j]] = Gamma[0,j+1]                                   # The corresponding Gamma for the neighbor node.
             
-        if p[i,2] == 1:                                                             # If the node is in the boundary.
+        if p[i,2] == 1 and sparse == False:                                         # If the node is in the boundary.
             K[i,i] = 0                                                              # Central node weight is equal to 0.
             for j in np.arange(nvec):                                               # For each of the neighbor nodes.
                 K[i, vec[i,j]] = 0                                                  # Neighbor node weight is equal to 0.
+
+    if sparse == True:                                                              # If a sparse matrix is requested.
+        K = sp.csr_matrix((val, (row, col)), shape = (m, m))                        # K is assembled from the triplets.
+    return K
+
+# Offsets (in x and y) of the central node and its neighbors in the Gammas of Mesh_Gammas.
+Stencil = [(0, 0), (-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+def Mesh_Gammas(x, y, L):
+    """
+    2D Logically Rectangular Meshes Batched Gammas Computation.
+
+    This function computes the Gamma values of all the inner nodes of a logically rectangular mesh at once.
+    The offsets to the 8 neighbors of each inner node are stacked into an (m-2)(n-2) x 5 x 8 array, so all the local
+    least-squares systems are solved with a single stacked pseudoinverse.
+
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        L           5 x 1           Array           Array with the values of the differential operator.
+
+    Output:
+        Gamma       m x n x 9       Array           Gammas for the central node and its neighbors, in the order of
+                                                    Stencil (zeros for the boundary nodes).
+    """
+    # Variable initialization
+    m     = len(x[:,0])                                                             # The number of nodes in x.
+    n     = len(x[0,:])                                                             # The number of nodes in y.
+    Gamma = np.zeros([m, n, 9])                                                     # Gamma initialization with zeros.
+
+    # Gammas computation
+    dx    = np.stack([x[1+a:m-1+a, 1+b:n-1+b] - x[1:-1,1:-1] for a, b in Stencil[1:]], axis = -1)
+    dy    = np.stack([y[1+a:m-1+a, 1+b:n-1+b] - y[1:-1,1:-1] for a, b in Stencil[1:]], axis = -1)
+    M     = np.stack([dx, dy, dx**2, dx*dy, dy**2], axis = -2).reshape(-1, 5, 8)   # M matrices are assembled.
+    YY    = Kernels.Pinv(M, L).reshape(m-2, n-2, 8)                                 # M^+ L for all the matrices M.
+    Gamma[1:-1,1:-1,0]  = -YY.sum(axis = -1)                                        # Gamma values for the central nodes.
+    Gamma[1:-1,1:-1,1:] = YY                                                        # Gamma values for the neighbor nodes.
+    return Gamma
+
+def Mesh(x, y, L, sparse = False, dtype = np.float64):
+    """
+    2D Logically Rectangular Meshes Gammas Computation.
+     
+    This function computes the Gamma values for Logically Rectangular Meshes, and assemble the K matrix for the computations.
+    All the Gammas are computed at once with Mesh_Gammas. The node (i, j) is stored in the position m*j + i, so each of the
+    9 points of the stencil is a diagonal of K, and a sparse K is assembled in DIAgonal format, whose matrix-vector
+    products are strided updates over the whole mesh.
+     
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        sparse                      bool            Select whether or not K is assembled as a sparse matrix.
+                                                        True: K is a scipy.sparse.dia_matrix.
+                                                        False: K is a dense ndarray (Default).
+        dtype                       dtype           Floating point type of K (Default: np.float64). The Gammas are
+                                                    computed in float64 and downcast afterward.
+     
+     Output:
+        K           m x m           Array           K Matrix with the computed Gammas.
+    """
+    m     = len(x[:,0])                                                             # The number of nodes in x.
+    n     = len(x[0,:])                                                             # The number of nodes in y.
+    N     = m*n                                                                     # The total number of nodes.
+    Gamma = Mesh_Gammas(x, y, L).astype(dtype).reshape(N, 9, order = 'F')           # Gammas of each node in the position m*j + i.
+
+    # Matrix assembly
+    offs  = [a + m*b for a, b in Stencil]                                           # Diagonal of each point of the stencil.
+    diag  = [Gamma[:N-o, k] if o >= 0 else Gamma[-o:, k] for k, o in enumerate(offs)]
+    K     = sp.diags(diag, offs, shape = (N, N), format = 'dia')                    # K is assembled by diagonals.
+    if sparse == False:                                                             # If a dense matrix is requested.
+        K = K.toarray()                                                             # K is converted to a dense matrix.
     return K
 
-def Mesh(x, y, L):
+def Mesh_old(x, y, L):
     """
+    (Outdated working version)
     2D Logically Rectangular Meshes Gammas Computation.
      
     This function computes the Gamma values for Logically Rectangular Meshes, and assemble the K matrix for the computations.
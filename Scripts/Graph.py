@@ -16,11 +16,42 @@ Last Modification:
     November, 2023.
 """
 
+import os
+import collections
+import multiprocessing
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib import cm
-import moviepy.editor as mpy
-from moviepy.video.io.bindings import mplfig_to_npimage
+
+# Plotting and video libraries.
+# matplotlib and moviepy are imported on the first call of any function of this module, so the scripts that import it
+# but never plot (or only run the solvers) do not pay their import time.
+plt = cm = Figure = Triangulation = mpy = mplfig_to_npimage = FFMPEG_VideoWriter = None
+
+def Load():
+    """
+    Load
+    Function to import, only once, the plotting and video libraries used by this module.
+
+    Input:
+        None
+
+    Output:
+        None
+    """
+    global plt, cm, Figure, Triangulation, mpy, mplfig_to_npimage, FFMPEG_VideoWriter
+    if plt is not None:                                                             # The libraries were already imported.
+        return
+    import matplotlib.pyplot as plt
+    from matplotlib import cm
+    from matplotlib.figure import Figure
+    from matplotlib.tri import Triangulation
+    import moviepy.editor as mpy
+    from moviepy.video.io.bindings import mplfig_to_npimage
+    from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+
+# State of each rendering process.
+# Every process of the pool keeps its own figure and the triangulation, so only the columns of the solutions are sent
+# for each frame.
+_Frame = {}
 
 def Cloud_Static_sav(p, tt, u_ap, u_ex, nom):
     """
@@ -40,6 +71,7 @@ def Cloud_Static_sav(p, tt, u_ap, u_ex, nom):
     Output:
         None
     """
+    Load()
     if tt.min() == 1:
         tt -= 1
     t    = len(u_ex[0,:])
@@ -88,7 +120,7 @@ def Cloud_Static_sav(p, tt, u_ap, u_ex, nom):
     plt.close()
 
 
-def Cloud_Transient(p, tt, u_ap, u_ex):
+def Cloud_Transient(p, tt, u_ap, u_ex, fast = False, blit = True):
     """
     Cloud_Transient
 
@@ -100,12 +132,18 @@ def Cloud_Transient(p, tt, u_ap, u_ex):
         tt          n x 3           Array           Array with the correspondence of the n triangles.
         u_ap        m x t           Array           Array with the computed solution.
         u_ex        m x t           Array           Array with the theoretical solution.
+        fast                        bool            Use the 2D preview of Cloud_Transient_fast (Default: False).
+        blit                        bool            Redraw only the solutions in the 2D preview (Default: True).
         
     Output:
         None
     """
+    Load()
     if tt.min() == 1:
         tt -= 1
+    if fast:                                                                        # For the 2D preview.
+        Cloud_Transient_fast(p, tt, u_ap, u_ex, blit)
+        return
     t    = len(u_ex[0,:])
     step = int(np.ceil(t/50))
     min  = u_ex.min()
@@ -145,13 +183,175 @@ def Cloud_Transient(p, tt, u_ap, u_ex):
     plt.pause(0.1)
 
 
-def Cloud_Transient_sav(p, tt, u_ap, u_ex, nom):
+def Cloud_Transient_fast(p, tt, u_ap, u_ex, blit = True):
+    """
+    Cloud_Transient_fast
+
+    This function graphs the approximated and theoretical solutions of the problem being solved at several time levels, as a fast 2D preview.
+    Both solutions are presented side by side, as colors over the triangulation, to help perform graphical comparisons between both solutions.
+    The triangulation and the plots are built only once; on each time level only the values of the solutions are updated and, with
+    blitting, only the solutions and the title are redrawn.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        u_ap        m x t           Array           Array with the computed solution.
+        u_ex        m x t           Array           Array with the theoretical solution.
+        blit                        bool            Redraw only the solutions and the title (Default: True).
+        
+    Output:
+        None
+    """
+    Load()
+    if tt.min() == 1:
+        tt -= 1
+    t      = len(u_ex[0,:])
+    step   = int(np.ceil(t/50))
+    min    = u_ex.min()
+    max    = u_ex.max()
+    T      = np.linspace(0,1,t)
+    levels = list(np.arange(0,t,step)) + [t-1]                                      # Time levels to be shown.
+    tri    = Triangulation(p[:,0], p[:,1], tt)                                      # The triangulation is built once.
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8, 4))
+    blit = blit and fig.canvas.supports_blit                                        # Only if the backend supports it.
+    sup  = fig.suptitle('Solution at t = %1.3f s.' %float(T[0]), animated = blit)
+    col1 = ax1.tripcolor(tri, u_ap[:,0], shading='gouraud', cmap=cm.coolwarm, vmin=min, vmax=max, animated=blit)
+    col2 = ax2.tripcolor(tri, u_ex[:,0], shading='gouraud', cmap=cm.coolwarm, vmin=min, vmax=max, animated=blit)
+    for ax, title in zip([ax1, ax2], ['Approximation', 'Theoretical Solution']):
+        ax.set_aspect('equal')
+        ax.set_title(title)
+    fig.colorbar(col2, ax=[ax1, ax2], shrink=0.8)
+
+    plt.show(block = False)
+    plt.pause(0.1)
+    if blit:                                                                        # The static part of the figure is stored.
+        bg = fig.canvas.copy_from_bbox(fig.bbox)
+
+    for k in levels:
+        sup.set_text('Solution at t = %1.3f s.' %float(T[k]))
+        col1.set_array(u_ap[:,k])                                                   # Only the values are updated.
+        col2.set_array(u_ex[:,k])
+        if blit:                                                                    # Only the updated artists are redrawn.
+            fig.canvas.restore_region(bg)
+            for art in [col1, col2, sup]:
+                fig.draw_artist(art)
+            fig.canvas.blit(fig.bbox)
+            fig.canvas.flush_events()
+        else:                                                                       # The whole figure is redrawn.
+            fig.canvas.draw_idle()
+            plt.pause(0.01)
+
+    plt.pause(0.1)
+
+def Frame_Init(p, tt, zmin, zmax, titles, figsize):
+    """
+    Frame_Init
+    Function to prepare, on each rendering process, the figure that is reused for all the frames drawn by the process.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        zmin                        float           Lower limit of the z axis.
+        zmax                        float           Upper limit of the z axis.
+        titles                      list            Title of each panel.
+        figsize                     tuple           Size of the figure.
+
+    Output:
+        None
+    """
+    Load()
+    fig = Figure(figsize = figsize)                                                 # Figure without pyplot.
+    axs = fig.subplots(1, len(titles), subplot_kw = {"projection": "3d"}, squeeze = False)[0]
+    _Frame.update(p = p, tt = tt, zlim = [zmin, zmax], titles = titles, fig = fig, axs = axs)
+
+def Frame(task):
+    """
+    Frame
+    Function to draw one frame on the figure of the process and return it as an RGB image.
+
+    Input:
+        task                        tuple           Time of the frame and the solution of each panel (tin, [u_1, ..., u_q]).
+
+    Output:
+        image       h x w x 3       Array           RGB image of the frame.
+    """
+    tin, cols = task                                                                # Time and solutions of the frame.
+    p, tt     = _Frame['p'], _Frame['tt']                                           # Nodes and triangles.
+    _Frame['fig'].suptitle('Solution at t = %1.3f s.' %tin)
+    for ax, u, title in zip(_Frame['axs'], cols, _Frame['titles']):                 # For each panel.
+        ax.clear()
+        ax.plot_trisurf(p[:,0], p[:,1], u, triangles=tt, cmap=cm.coolwarm, linewidth=0, antialiased=False)
+        ax.set_zlim(_Frame['zlim'])
+        ax.set_title(title)
+    return mplfig_to_npimage(_Frame['fig'])
+
+def Frames_sav(p, tt, sols, zmin, zmax, titles, figsize, nom, workers = None):
+    """
+    Frames_sav
+    Function to render the frames of a transient solution and write them, as video, on drive.
+    The frames are drawn by a pool of processes, each with its own figure, and written to the video in order as soon as
+    they are ready; only a few frames per process are kept in memory at any time.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        sols                        list            Solutions shown on each panel, each one m x t.
+        zmin                        float           Lower limit of the z axis.
+        zmax                        float           Upper limit of the z axis.
+        titles                      list            Title of each panel.
+        figsize                     tuple           Size of the figure.
+        nom                         String          Name of the file to be saved to drive.
+        workers                     int             Number of rendering processes (Default: None, all the CPUs).
+
+    Output:
+        None
+    """
+    Load()
+    t      = len(sols[0][0,:])
+    step   = int(np.ceil(t/50))
+    T      = np.linspace(0,1,t)
+    levels = list(np.arange(0,t,step)) + [t-1]                                      # Time levels of the frames.
+    tasks  = ((float(T[k]), [u[:,k] for u in sols]) for k in levels)                # Data of each frame.
+    if workers is None:
+        workers = os.cpu_count() or 1                                               # All the CPUs are used.
+    args   = (p[:,0:2], tt, zmin, zmax, titles, figsize)                            # Data shared by all the frames.
+    writer = None
+
+    def write(image):
+        nonlocal writer
+        if writer is None:                                                          # The size of the video is that of the first frame.
+            writer = FFMPEG_VideoWriter(nom, (image.shape[1], image.shape[0]), fps = 10)
+        writer.write_frame(image)
+
+    try:
+        if workers <= 1:                                                            # Without processes.
+            Frame_Init(*args)
+            for task in tasks:
+                write(Frame(task))
+        else:                                                                       # With a pool of processes.
+            ctx = multiprocessing.get_context()                                     # Context of the processes.
+            with ctx.Pool(workers, initializer = Frame_Init, initargs = args) as pool:
+                pend = collections.deque()                                          # Frames being drawn, in order.
+                for task in tasks:
+                    pend.append(pool.apply_async(Frame, (task,)))
+                    if len(pend) >= 2*workers:                                      # The oldest frame is written.
+                        write(pend.popleft().get())
+                while pend:                                                         # The remaining frames are written.
+                    write(pend.popleft().get())
+    finally:
+        _Frame.clear()
+        if writer is not None:
+            writer.close()
+
+def Cloud_Transient_sav(p, tt, u_ap, u_ex, nom, workers = None):
     """
     Cloud_Transient_sav
 
     This function graphs and saves the approximated and theoretical solutions of the problem being solved at several time levels.
     Both solutions are presented side by side to help perform graphical comparisons between both solutions.
     The graphics are stored, as video, on drive on the current path, or whatever path were provided on "nom".
+    The frames are drawn in parallel and streamed to the video, so the memory used does not grow with the number of frames.
 
     Input:
         p           m x 2           Array           Array with the coordinates of the nodes.
@@ -159,10 +359,36 @@ def Cloud_Transient_sav(p, tt, u_ap, u_ex, nom):
         u_ap        m x t           Array           Array with the computed solution.
         u_ex        m x t           Array           Array with the theoretical solution.
         nom                         String          Name of the files to be saved to drive.
+        workers                     int             Number of rendering processes (Default: None, all the CPUs).
     
     Output:
         None
     """
+    Load()
+    if tt.min() == 1:
+        tt -= 1
+    Frames_sav(p, tt, [u_ap, u_ex], u_ex.min(), u_ex.max(), ['Approximation', 'Theoretical Solution'], (8, 4), nom, workers)
+
+def Cloud_Transient_sav_old(p, tt, u_ap, u_ex, nom):
+    """
+    Cloud_Transient_sav_old
+    (Outdated working version)
+
+    This function graphs and saves the approximated and theoretical solutions of the problem being solved at several time levels.
+    Both solutions are presented side by side to help perform graphical comparisons between both solutions.
+    The graphics are stored, as video, on drive on the current path, or whatever path were provided on "nom".
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        u_ap        m x t           Array           Array with the computed solution.
+        u_ex        m x t           Array           Array with the theoretical solution.
+        nom                         String          Name of the files to be saved to drive.
+    
+    Output:
+        None
+    """
+    Load()
     if tt.min() == 1:
         tt -= 1
     t      = len(u_ex[0,:])
@@ -207,6 +433,7 @@ def Cloud_Transient_sav(p, tt, u_ap, u_ex, nom):
     animation.write_videofile(nom, fps=10, verbose=False, logger=None)
 
 def Cloud_Transient_1(p, tt, u_ap):
+    Load()
     if tt.min() == 1:
         tt -= 1
     t      = len(u_ap[0,:])
@@ -235,7 +462,35 @@ def Cloud_Transient_1(p, tt, u_ap):
     
     plt.pause(0.1)
 
-def Cloud_Transient_sav_1(p, tt, u_ap, nom):
+def Cloud_Transient_sav_1(p, tt, u_ap, nom, workers = None):
+    """
+    Cloud_Transient_sav_1
+
+    This function graphs and saves the approximated solution of the problem being solved at several time levels.
+    The graphics are stored, as video, on drive on the current path, or whatever path were provided on "nom".
+    The frames are drawn in parallel and streamed to the video, so the memory used does not grow with the number of frames.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        u_ap        m x t           Array           Array with the computed solution.
+        nom                         String          Name of the files to be saved to drive.
+        workers                     int             Number of rendering processes (Default: None, all the CPUs).
+    
+    Output:
+        None
+    """
+    Load()
+    if tt.min() == 1:
+        tt -= 1
+    Frames_sav(p, tt, [u_ap], u_ap.min(), u_ap.max(), ['Approximation'], (10, 5), nom, workers)
+
+def Cloud_Transient_sav_1_old(p, tt, u_ap, nom):
+    """
+    Cloud_Transient_sav_1_old
+    (Outdated working version)
+    """
+    Load()
     if tt.min() == 1:
         tt -= 1
     t      = len(u_ap[0,:])
@@ -283,6 +538,7 @@ def Error(er):
     Output:
         None
     """
+    Load()
     t = len(er)
     T = np.linspace(0,1,t)
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
@@ -313,6 +569,7 @@ def Error_sav(er,nom):
     Output:
         None
     """
+    Load()
     t = len(er)
     T = np.linspace(0,1,t)
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
@@ -343,6 +600,7 @@ def Multi_Error(er1, er2, regi, cloud):
     Output:
         None
     """
+    Load()
     t = len(er1)
     T = np.linspace(0,3,t)
     fig, (ax1) = plt.subplots(1, 1, figsize=(10, 4))
@@ -368,6 +626,7 @@ def Multi_Error_sav(er1, er2, regi, cloud):
     Output:
         None
     """
+    Load()
     t = len(er1)
     T = np.linspace(0,3,t)
     fig, (ax1) = plt.subplots(1, 1, figsize=(10, 4))
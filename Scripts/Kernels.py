@@ -0,0 +1,123 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+# Optional accelerated kernels.
+# If Numba is installed, the local Gamma systems and the sparse matrix-vector products of the time stepping are computed
+# with compiled kernels running in parallel over the nodes (compiled once and cached on disk). If it is not installed,
+# the same operations are computed with NumPy and SciPy. Numba is only imported by Load, on the first use of the kernels,
+# so importing the solvers does not import it.
+Numba  = None                                                                       # Unknown until Load is called.
+prange = range                                                                      # Replaced by numba.prange in Load.
+
+def Pinv_Kernel(M, L):
+    q  = M.shape[0]                                                                 # The number of local systems.
+    YY = np.zeros((q, M.shape[2]))                                                  # YY initialization with zeros.
+    for i in prange(q):                                                             # For each local system.
+        YY[i,:] = np.dot(np.linalg.pinv(np.ascontiguousarray(M[i])), L)             # M*L computation.
+    return YY
+
+def Matvec_Kernel(data, indices, indptr, x):
+    m = indptr.size - 1                                                             # The number of rows.
+    y = np.zeros(m)                                                                 # y initialization with zeros.
+    for i in prange(m):                                                             # For each row.
+        s = 0.0
+        for k in range(indptr[i], indptr[i+1]):                                     # For each nonzero of the row.
+            s += data[k]*x[indices[k]]
+        y[i] = s
+    return y
+
+def Matmat_Kernel(data, indices, indptr, X):
+    m = indptr.size - 1                                                             # The number of rows.
+    Y = np.zeros((m, X.shape[1]))                                                   # Y initialization with zeros.
+    for i in prange(m):                                                             # For each row.
+        for k in range(indptr[i], indptr[i+1]):                                     # For each nonzero of the row.
+            for e in range(X.shape[1]):                                             # For each column.
+                Y[i,e] += data[k]*X[indices[k],e]
+    return Y
+
+def Load():
+    """
+    Load
+    Function to import Numba, only once, and to turn the kernels into compiled functions.
+
+    Input:
+        None
+
+    Output:
+        Numba                       bool            Whether or not the compiled kernels are available.
+    """
+    global Numba, prange, Pinv_Kernel, Matvec_Kernel, Matmat_Kernel
+    if Numba is not None:                                                           # Numba was already looked for.
+        return Numba
+    try:
+        import numba
+    except ImportError:                                                             # If Numba is not installed.
+        Numba = False                                                               # NumPy and SciPy are used.
+        return Numba
+    prange        = numba.prange                                                    # Parallel loops of the kernels.
+    jit           = numba.njit(parallel = True, cache = True)                       # Compilation of the kernels.
+    Pinv_Kernel   = jit(Pinv_Kernel)
+    Matvec_Kernel = jit(Matvec_Kernel)
+    Matmat_Kernel = jit(Matmat_Kernel)
+    Numba         = True                                                            # The compiled kernels are available.
+    return Numba
+
+def Pinv(M, L):
+    """
+    Pinv
+    Function to solve a stack of local least-squares systems with the pseudoinverse of each matrix.
+
+    Input:
+        M           q x 5 x nvec    Array           Stack of the matrices of the local systems.
+        L           5 x 1           Array           Array with the values of the differential operator.
+
+    Output:
+        YY          q x nvec        Array           Product of the pseudoinverse of each matrix and L.
+    """
+    if len(M) > 0 and Load():                                                       # If the compiled kernels are available.
+        return Pinv_Kernel(np.ascontiguousarray(M, dtype = np.float64), np.ravel(L).astype(np.float64))
+    return (np.linalg.pinv(M)@L)[:,:,0]                                             # Stacked pseudoinverse.
+
+def Operator(K):
+    """
+    Operator
+    Function to prepare a matrix for the repeated products of the time stepping.
+    With Numba, a CSR matrix is wrapped in a linear operator whose products run in parallel over the rows; any other
+    matrix, or any matrix without Numba, is returned unchanged.
+
+    Input:
+        K           m x m           Array           Matrix of the scheme (dense or sparse).
+
+    Output:
+        K           m x m                           Matrix or linear operator with the same products K@u.
+    """
+    if not sp.issparse(K) or K.format != 'csr' or K.dtype != np.float64 or not Load():
+        return K
+    data, indices, indptr = K.data, K.indices, K.indptr                             # Arrays of the CSR matrix.
+
+    def matvec(x):
+        return Matvec_Kernel(data, indices, indptr, np.ascontiguousarray(np.ravel(x), dtype = np.float64))
+
+    def matmat(X):
+        return Matmat_Kernel(data, indices, indptr, np.ascontiguousarray(X, dtype = np.float64))
+
+    return spla.LinearOperator(K.shape, matvec = matvec, matmat = matmat, dtype = K.dtype)
@@ -17,11 +17,50 @@ Last Modification:
 """
 
 import numpy as np
+import scipy.sparse as sp
+from scipy.spatial import cKDTree
 
 def Triangulation(p, tt, nvec):
     """
     Triangulation
     Function to find the neighbor nodes in a triangulation.
+    The adjacency of all the nodes is built in one pass from the edges of the triangles as a sparse matrix, whose sorted
+    rows give the neighbors of each node in increasing order, as in Triangulation_old.
+    
+    Input:
+        p           m x 2           double          Array with the coordinates of the nodes.
+        tt          n x 3           double          Array with the correspondence of the n triangles.
+        nvec                        integer         Maximum number of neighbors.
+    
+    Output:
+        vec         m x nvec        double          Array with matching neighbors of each node.
+    """
+
+    # Variable initialization
+    m   = len(p[:,0])                                                               # The size if the triangulation is obtained.
+    vec = np.zeros([m, nvec], dtype=int)-1                                          # The array for the neighbors is initialized.
+    tt  = np.asarray(tt, dtype=int)                                                 # Indexes of the triangles as integers.
+
+    # Adjacency matrix
+    row = tt[:, [0, 0, 1, 1, 2, 2]].flatten()                                       # Starting node of each edge.
+    col = tt[:, [1, 2, 0, 2, 0, 1]].flatten()                                       # Ending node of each edge.
+    ind = row != col                                                                # Degenerated edges are discarded.
+    A   = sp.csr_matrix((np.ones(ind.sum()), (row[ind], col[ind])), shape = (m, m)) # Adjacency matrix of the nodes.
+    A.sum_duplicates()                                                              # Repeated edges are merged and sorted.
+
+    # Neighbor search
+    nnz = np.diff(A.indptr)                                                         # The number of neighbors of each node.
+    row = np.repeat(np.arange(m), nnz)                                              # The node of each neighbor.
+    pos = np.arange(len(A.indices)) - np.repeat(A.indptr[:-1], nnz)                 # Position of each neighbor for its node.
+    ind = pos < nvec                                                                # Only the first nvec neighbors are kept.
+    vec[row[ind], pos[ind]] = A.indices[ind]                                        # Neighbors are saved.
+    return vec
+
+def Triangulation_old(p, tt, nvec):
+    """
+    Triangulation
+    (Outdated working version)
+    Function to find the neighbor nodes in a triangulation.
     
     Input:
         p           m x 2           double          Array with the coordinates of the nodes.
@@ -51,6 +90,59 @@ def Cloud(p, nvec):
     """
     Clouds
     Routine to find the neighbor nodes in a cloud of points generated with dmsh on Python.
+    The nearest neighbor and radius queries are performed in bulk with a KD-tree, and the candidates of each node are
+    processed in increasing index order, keeping the closest nvec of them, so the result is the same as in Cloud_old.
+    
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        nvec                        integer         Maximum number of neighbors.
+    
+    Output:
+        vec         m x nvec        double          Array with matching neighbors of each node.
+    """
+
+    # Variable initialization
+    m    = len(p[:,0])                                                              # The size if the triangulation is obtained.
+    x    = p[:,0]                                                                   # x coordinates of the nodes.
+    y    = p[:,1]                                                                   # y coordinates of the nodes.
+    tree = cKDTree(p[:,0:2])                                                        # KD-tree with the coordinates of the nodes.
+
+    # Delta computation for finding neighbors
+    dmin = tree.query(p[:,0:2], k = 2)[0][:,1]                                      # Distance from each node to the closest one.
+    dist = (3/2)*min(1, dmin.max())                                                 # Tolerance distance ("big" value of 1 as limit).
+
+    # Search of the candidates
+    pair = tree.sparse_distance_matrix(tree, dist, output_type = 'ndarray')         # All the pairs of nodes closer than dist.
+    i, j = pair['i'], pair['j']                                                     # Central and possible neighbor nodes.
+    d    = np.sqrt((x[i] - x[j])**2 + (y[i] - y[j])**2)                             # Distance from the possible neighbor to the central node.
+    keep = (i != j) & (d < dist)                                                    # Candidates strictly closer than dist.
+    i, j = i[keep], j[keep]                                                         # Only the candidates are kept.
+    ind  = np.lexsort((j, i))                                                       # Candidates sorted by node and by index.
+    i, j = i[ind], j[ind]                                                           # The candidates are sorted.
+    nc   = np.bincount(i, minlength = m)                                            # Number of candidates of each node.
+    pos  = np.arange(len(i)) - np.repeat(np.cumsum(nc) - nc, nc)                    # Position of each candidate for its node.
+    cand = np.zeros([m, max(nvec, nc.max(initial = 0))], dtype=int) - 1             # The array for the candidates is initialized.
+    cand[i, pos] = j                                                                # The candidates are saved.
+
+    # Search of the neighbor nodes
+    vec  = cand[:, :nvec].copy()                                                    # The first nvec candidates are the neighbors.
+    for k in np.arange(nvec, cand.shape[1]):                                        # For the remaining candidates.
+        rows = np.flatnonzero(cand[:, k] != -1)                                     # Nodes with a k-th candidate.
+        new  = cand[rows, k]                                                        # The k-th candidate of the nodes.
+        d    = np.sqrt((x[rows] - x[new])**2 + (y[rows] - y[new])**2)               # Distance from the candidate to the central node.
+        x2   = x[vec[rows,:]] - x[rows,np.newaxis]                                  # x distance to the current neighbor nodes.
+        y2   = y[vec[rows,:]] - y[rows,np.newaxis]                                  # y distance to the current neighbor nodes.
+        d2   = np.sqrt(x2**2 + y2**2)                                               # The total distance from all the neighbors.
+        I    = np.argmax(d2, axis = 1)                                              # Look for the greatest distance.
+        repl = d < d2[np.arange(len(rows)), I]                                      # If the new node is closer than the farthest neighbor.
+        vec[rows[repl], I[repl]] = new[repl]                                        # The new neighbor replace the farthest one.
+    return vec
+
+def Cloud_old(p, nvec):
+    """
+    Clouds
+    (Outdated working version)
+    Routine to find the neighbor nodes in a cloud of points generated with dmsh on Python.
     
     Input:
         p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
@@ -0,0 +1,285 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+def Partition(vec, parts):
+    """
+    Partition
+    Function to split the nodes of a cloud of points into spatially compact partitions.
+    The graph given by the neighbors is bisected recursively: the nodes of each part are sorted by their Reverse
+    Cuthill-McKee (breadth-first) levels and split in two, with sizes proportional to the number of parts of each half.
+
+    Input:
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        parts                       int             Number of partitions.
+
+    Output:
+        part        m x 1           Array           Partition of each node.
+    """
+    m     = len(vec[:,0])                                                           # The total number of nodes.
+    mask  = vec != -1                                                               # Mask with the existing neighbors.
+    row   = np.repeat(np.arange(m), vec.shape[1])[mask.ravel()]                     # Node of each edge.
+    A     = sp.csr_matrix((np.ones(len(row)), (row, vec[mask])), shape = (m, m))    # Adjacency matrix.
+    A     = (A + A.T).tocsr()                                                       # The graph is symmetrized.
+    part  = np.zeros(m, dtype=int)                                                  # part initialization with zeros.
+    stack = [(np.arange(m), parts, 0)]                                              # Parts to be bisected.
+    while stack:                                                                    # While there are parts to be bisected.
+        nodes, n, first = stack.pop()                                               # Nodes, number of parts and first part.
+        if n == 1:                                                                  # If the part is not bisected.
+            part[nodes] = first                                                     # The nodes are assigned to the part.
+            continue
+        sub   = A[nodes][:, nodes]                                                  # Graph of the part.
+        level = reverse_cuthill_mckee(sub, symmetric_mode = True)                   # Breadth-first ordering of the part.
+        half  = n//2                                                                # Number of parts of the first half.
+        cut   = len(nodes)*half//n                                                  # Number of nodes of the first half.
+        stack.append((nodes[level[:cut]], half, first))                             # First half.
+        stack.append((nodes[level[cut:]], n - half, first + half))                  # Second half.
+    return part
+
+def Blocks(A, own, loc):
+    """
+    Blocks
+    Function to split the rows of a worker of a matrix into the block of its own nodes, already factored, and the block
+    of its halo nodes.
+
+    Input:
+        A           m x m           Array           Matrix of the system (sparse).
+        own         n x 1           Array           Nodes of the worker.
+        loc         l x 1           Array           Own nodes of the worker, followed by its halo nodes.
+
+    Output:
+        solve                       function        Solver for the block of the own nodes.
+        Aoh         n x h           Array           Block of the halo nodes.
+    """
+    n   = len(own)                                                                  # The number of own nodes.
+    Al  = A[own][:, loc]                                                            # Rows of the worker.
+    Aoo = sp.csc_matrix(Al[:, :n])                                                  # Block of the own nodes.
+    Aoh = sp.csr_matrix(Al[:, n:])                                                  # Block of the halo nodes.
+    return spla.splu(Aoo).solve, Aoh
+
+def Worker(name, m, workers, w, own, loc, inne, bnd, po, data, f, g, T, c, cho, r, implicit, tol, maxiter, step, inner, timeout):
+    """
+    Worker
+    Function with the time integration of the rows of a partition.
+    Each time step, the worker reads the values of its own and halo nodes of the two previous time levels from the shared
+    memory, computes the new time level of its own nodes and writes it back. For the implicit scheme, the systems are
+    solved with block-Jacobi iterations, where each worker solves its own block with a sparse LU factorization.
+
+    Input:
+        name                        string          Name of the shared memory block.
+        m                           int             The total number of nodes.
+        workers                     int             The number of workers.
+        w                           int             Index of the worker.
+        own         n x 1           Array           Nodes of the worker.
+        loc         l x 1           Array           Own nodes of the worker, followed by its halo nodes.
+        inne        n x 1           Array           Mask with the inner nodes of the worker.
+        bnd         n x 1           Array           Mask with the boundary nodes of the worker.
+        po          n x 3           Array           Coordinates of the nodes of the worker.
+        data                        tuple           Local operators (B1, B2, A1, A2) of the worker.
+        f, g, T, c, cho, r                          Parameters of the problem (see Stream).
+        implicit, tol, maxiter                      Parameters of the scheme (see Stream).
+        step                        Barrier         Barrier of the workers and the main process at each time step.
+        inner                       Barrier         Barrier of the workers at each block-Jacobi iteration.
+        timeout                     float           Seconds to wait at each block-Jacobi barrier (see Stream).
+
+    Output:
+        None
+    """
+    shm = shared_memory.SharedMemory(name = name)                                   # The shared memory is attached.
+    try:
+        S   = np.ndarray(5*m + 2*workers + 1, dtype = np.float64, buffer = shm.buf)  # Shared buffer.
+        U   = S[:3*m].reshape(3, m)                                                 # The last three time levels.
+        X   = S[3*m:5*m].reshape(2, m)                                              # Block-Jacobi iterates.
+        R   = S[5*m:5*m + 2*workers].reshape(2, workers)                            # Updates of each worker.
+        n   = len(own)                                                              # The number of own nodes.
+        dt  = T[1] - T[0]                                                           # dt computation.
+        B1, B2, A1, A2 = data                                                       # Local operators.
+        for k in range(1, len(T)):                                                  # For al time levels.
+            cur, prev = U[(k-1) % 3], U[(k-2) % 3]                                  # Previous time levels.
+            if k == 1:                                                              # For the first time level.
+                b = B1@cur[loc] + dt*(np.zeros(n) + g(po[:,0], po[:,1], T[k], c, cho, r))
+                A = A1                                                              # Operator for k = 1.
+                x = cur[own]                                                        # Initial guess.
+            else:                                                                   # For all the other time levels.
+                b = B2@cur[loc] - prev[own]                                         # Right-hand side.
+                A = A2                                                              # Operator for k = 2,...,t.
+                x = 2*cur[own] - prev[own]                                          # Initial guess.
+            if implicit == True:                                                    # For the implicit scheme.
+                solve, Aoh = A                                                      # Blocks of the operator.
+                X[0, own] = x                                                       # The initial guess is shared.
+                inner.wait(timeout)
+                a = 0                                                               # Index of the current iterate.
+                for it in range(maxiter):                                           # For each block-Jacobi iteration.
+                    xn = solve(b - Aoh@X[a, loc[n:]])                               # The own block is solved.
+                    X[1-a, own] = xn                                                # The new iterate is shared.
+                    R[it % 2, w] = np.max(np.abs(xn - x), initial = 0)/max(np.max(np.abs(xn), initial = 0), 1e-300)
+                    x = xn                                                          # The iterate is updated.
+                    inner.wait(timeout)
+                    a = 1 - a                                                       # The iterates are swapped.
+                    if R[it % 2].max() <= tol:                                      # If all the workers converged.
+                        break
+                else:                                                               # If the tolerance was not reached.
+                    if w == 0:                                                      # The first worker reports.
+                        print('\tThe block-Jacobi iterations did not converge after', maxiter, 'iterations.')
+                if w == 0:                                                          # The first worker reports.
+                    S[-1] = it + 1                                                  # The number of iterations.
+            else:                                                                   # For the explicit scheme.
+                x = b                                                               # No system has to be solved.
+            u_n = np.zeros(n)                                                       # New time level initialization with zeros.
+            u_n[inne] = x[inne]                                                     # Save the computed solution.
+            if cho == 1:                                                            # Approximation Type selection.
+                u_n[bnd] = f(po[bnd,0], po[bnd,1], T[k], c, cho, r)                 # The boundary condition is assigned.
+            U[k % 3, own] = u_n                                                     # The new time level is shared.
+            step.wait()
+    except BaseException:                                                           # If the worker fails.
+        step.abort()                                                                # The main process is released.
+        inner.abort()                                                               # The other workers are released.
+        raise
+    finally:
+        S = U = X = R = cur = prev = None                                           # The views of the buffer are released.
+        shm.close()                                                                 # The shared memory is detached.
+
+def Stream(p, f, g, t, c, cho, r, geometry, implicit = False, lam = 0.5, workers = 2, steps = None, tol = 1e-10, maxiter = None, its = None, timeout = 600):
+    '''
+    Domain-decomposition time integration of the 2D wave equation.
+
+    This generator works as Wave_2D.Stream, but the nodes are split with Partition and each worker process owns the rows of
+    K of one partition. The time levels live in a shared memory block, so each worker reads the values of its halo nodes
+    written by the other workers, and all the workers and the main process are synchronized once per time step. The
+    explicit steps are fully parallel; the implicit steps use block-Jacobi iterations until the relative update is below
+    tol. On platforms without fork, f and g must be picklable.
+    The workers are watched while the main process waits for them: if a worker dies, or a time step takes longer than
+    timeout seconds, the barriers are broken and a RuntimeError is raised instead of waiting forever. The workers wait
+    without timeout only for the main process, since the caller may take any time between two time steps.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        f                           function        Function declared with the boundary condition.
+        g                           function        Function declared with the boundary condition.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+        r           1 x 2           ndarray         Coordinates of the water drop-like function.
+        geometry                    tuple           Neighbors and Gammas (vec, K0) computed by Wave_2D.Geometry.
+        implicit                    bool            Select whether or not use an implicit scheme (Default: False).
+        lam                         float           Lambda parameter for the implicit scheme (Default: 0.5).
+        workers                     int             Number of worker processes (Default: 2).
+        steps                       array           Time steps to be yielded (Default: None, all of them).
+        tol                         float           Relative tolerance for the block-Jacobi iterations (Default: 1e-10).
+        maxiter                     int             Maximum number of block-Jacobi iterations (Default: None, 200).
+        its                         list            List where the number of iterations of each time step is appended.
+        timeout                     float           Seconds to wait for the workers at each time step (Default: 600, None waits forever).
+
+    Output:
+        k                           int             Index of the time step.
+        T[k]                        float           Time of the time step.
+        u_k         m x 1           ndarray         Approximation computed on the time step.
+    '''
+    m       = len(p[:,0])                                                           # The total number of nodes is calculated.
+    T       = np.linspace(0,1,t)                                                    # Time discretization.
+    dt      = T[1] - T[0]                                                           # dt computation.
+    maxiter = 200 if maxiter is None else maxiter                                   # Maximum number of iterations.
+    lam     = lam if implicit == True else 1                                        # The explicit scheme is lam = 1.
+    sel     = np.ones(t, dtype=bool)                                                # Time steps to be yielded.
+    if steps is not None:                                                           # If only some time steps are requested.
+        sel[:] = False                                                              # No time step is selected.
+        sel[np.asarray(steps, dtype=int)] = True                                    # The requested time steps are selected.
+
+    # Operators of the scheme
+    vec, K0 = geometry                                                              # Neighbors and Gammas.
+    K  = (c**2)*(dt**2)*sp.csr_matrix(K0)                                           # K is scaled with c^2 dt^2.
+    I  = sp.identity(m, format = 'csr')                                             # Sparse identity matrix.
+    B1 = (I + lam*(1/2)*K).tocsr()                                                  # Formulation of K for k = 1.
+    B2 = (2*I + lam*K).tocsr()                                                      # Formulation of K for k = 2,...,t.
+    A1 = (I - (1-lam)*(1/2)*K).tocsr()                                              # System for k = 1.
+    A2 = (I - (1-lam)*K).tocsr()                                                    # System for k = 2,...,t.
+
+    # Partitions and halos
+    part = Partition(vec, workers)                                                  # Partition of each node.
+    jobs = []                                                                       # Data of each worker.
+    for w in range(workers):                                                        # For each worker.
+        own  = np.flatnonzero(part == w)                                            # Nodes of the worker.
+        cols = np.unique(np.concatenate([B2[own].indices, A2[own].indices]))        # Columns used by the worker.
+        halo = np.setdiff1d(cols, own)                                              # Halo nodes of the worker.
+        loc  = np.concatenate([own, halo])                                          # Own nodes followed by the halo.
+        data = (B1[own][:, loc], B2[own][:, loc], \
+                Blocks(A1, own, loc) if implicit else None, Blocks(A2, own, loc) if implicit else None)
+        jobs.append((own, loc, p[own,2] == 0, p[own,2] != 0, p[own], data))
+
+    # Shared memory
+    shm  = shared_memory.SharedMemory(create = True, size = 8*(5*m + 2*workers + 1))
+    S    = np.ndarray(5*m + 2*workers + 1, dtype = np.float64, buffer = shm.buf)    # Shared buffer.
+    S[:] = 0                                                                        # Shared buffer initialization with zeros.
+    U    = S[:3*m].reshape(3, m)                                                    # The last three time levels.
+    U[0] = f(p[:, 0], p[:, 1], T[0], c, cho, r)                                     # The initial condition is assigned.
+
+    ctx   = multiprocessing.get_context()                                           # Context of the processes.
+    step  = ctx.Barrier(workers + 1)                                                # Barrier of each time step.
+    inner = ctx.Barrier(workers)                                                    # Barrier of each iteration.
+    procs = [ctx.Process(target = Worker, args = (shm.name, m, workers, w) + jobs[w] + \
+             (f, g, T, c, cho, r, implicit, tol, maxiter, step, inner, timeout), daemon = True) for w in range(workers)]
+    stop  = threading.Event()                                                       # End of the watch of the workers.
+
+    def Watch():
+        while not stop.wait(0.1):                                                   # While the workers are running.
+            if any(proc.exitcode not in (None, 0) for proc in procs):               # If a worker died.
+                step.abort()                                                        # The main process is released.
+                inner.abort()                                                       # The other workers are released.
+                return
+
+    watch = threading.Thread(target = Watch, daemon = True)                         # Thread watching the workers.
+    try:
+        for proc in procs:                                                          # For each worker.
+            proc.start()                                                            # The worker is started.
+        watch.start()                                                               # The workers are watched.
+        if sel[0]:                                                                  # If the time step is requested.
+            yield 0, T[0], U[0].copy()
+        for k in range(1,t):                                                        # For al time levels.
+            try:
+                step.wait(timeout)                                                  # The time level is computed.
+            except threading.BrokenBarrierError:                                    # If a worker failed or timed out.
+                step.abort()                                                        # The barriers are broken for all.
+                inner.abort()
+                for proc in procs:                                                  # For each worker.
+                    proc.join(1)                                                    # The released worker finishes.
+                codes = [proc.exitcode for proc in procs]                           # Exit codes of the workers.
+                if any(code not in (None, 0) for code in codes):                    # If a worker died.
+                    raise RuntimeError('A worker process of the domain decomposition failed (exit codes: ' + str(codes) + ').') from None
+                raise RuntimeError('The workers of the domain decomposition did not finish time step ' + str(k) + \
+                                   ' within ' + str(timeout) + ' seconds.') from None
+            if implicit == True and its is not None:                                # If the iterations are requested.
+                its.append(int(S[-1]))                                              # The number of iterations is saved.
+            if sel[k]:                                                              # If the time step is requested.
+                yield k, T[k], U[k % 3].copy()
+        for proc in procs:                                                          # For each worker.
+            proc.join(timeout)                                                      # The worker finishes.
+    finally:
+        stop.set()                                                                  # The watch is finished.
+        for proc in procs:                                                          # For each worker.
+            if proc.is_alive():                                                     # If it is still running.
+                proc.terminate()                                                    # The worker is stopped.
+        del U, S                                                                    # The views of the buffer are released.
+        shm.close()                                                                 # The shared memory is detached.
+        shm.unlink()                                                                # The shared memory is released.
@@ -0,0 +1,48 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import numpy as np
+
+# Boundary conditions of the examples
+# Example 1
+#     f = \cos{\pi t}\sin{\pi(x + y)}
+# Example 2
+#     f = \cos(\pi c t\sqrt{2})\sin(\pi x)\sin(\pi y)
+# Example 3
+#     f = 0.2\exp(-((x - r_x - ct)^2 + (y - r_y - ct)^2)/0.0005)
+
+def f1(x, y, t, c, cho, r):
+    return np.cos(np.pi*t)*np.sin(np.pi*(x+y))
+
+def f2(x, y, t, c, cho, r):
+    return np.cos(np.sqrt(2)*np.pi*c*t)*np.sin(np.pi*x)*np.sin(np.pi*y)
+
+def f3(x, y, t, c, cho, r):
+    return 0.2*np.exp((-(x - r[0] - c*t)**2 - (y - r[1] - c*t)**2)/.0005)
+
+def g0(x, y, t, c, cho, r):
+    return 0
+
+# Problems: functions f and g, wave coefficient and approximation type.
+Problems = {'Example_1': (f1, g0, np.sqrt(1/2), 1),
+            'Example_2': (f2, g0, 1, 1),
+            'Example_3': (f3, f3, 1, 0)}
+
+# Initial drops of Example 3.
+Drops = {'CAB': [0.5, 0.6], 'CUA': [0.7, 0.5], 'CUI': [0.4, 0.6], 'DOW': [0.4, 0.6], 'ENG': [0.7, 0.3],
+         'GIB': [0.2, 0.4], 'HAB': [0.8, 0.8], 'MIC': [0.3, 0.3], 'PAT': [0.8, 0.8], 'ZIR': [0.7, 0.5]}
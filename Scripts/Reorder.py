@@ -0,0 +1,151 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.spatial import cKDTree
+
+def RCM(p, tt = None, nvec = 8):
+    """
+    RCM
+    Function to compute the Reverse Cuthill-McKee ordering of the nodes of a cloud of points.
+    The graph is given by the edges of the triangles or, if there are no triangles, by the nvec nearest nodes of each node.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles (Default: None).
+        nvec                        int             Number of nearest nodes used when there are no triangles (Default: 8).
+
+    Output:
+        perm        m x 1           Array           New ordering of the nodes.
+    """
+    m = len(p[:,0])                                                                 # The total number of nodes.
+    if tt is not None:                                                              # If there are triangles available.
+        tt  = np.asarray(tt, dtype=int)                                             # Indices of the triangles.
+        row = tt[:, [0, 1, 2]].ravel()                                              # First node of each edge.
+        col = tt[:, [1, 2, 0]].ravel()                                              # Second node of each edge.
+    else:                                                                           # If there are no triangles available.
+        k   = min(nvec + 1, m)                                                      # The node itself and its nearest nodes.
+        _, col = cKDTree(p[:, 0:2]).query(p[:, 0:2], k = k)                         # Nearest nodes of each node.
+        row = np.repeat(np.arange(m), k)                                            # Node of each edge.
+        col = np.reshape(col, -1)                                                   # Nearest node of each edge.
+    A = sp.csr_matrix((np.ones(len(row)), (row, col)), shape = (m, m))              # Adjacency matrix.
+    A = A + A.T                                                                     # The graph is symmetrized.
+    return np.asarray(reverse_cuthill_mckee(A.tocsr(), symmetric_mode = True), dtype=int)
+
+def Morton(p, bits = 16):
+    """
+    Morton
+    Function to compute the ordering of the nodes of a cloud of points along the Morton (Z-order) space-filling curve.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        bits                        int             Number of bits of each coordinate (Default: 16).
+
+    Output:
+        perm        m x 1           Array           New ordering of the nodes.
+    """
+    xy   = p[:, 0:2] - p[:, 0:2].min(axis = 0)                                      # Coordinates from the lower corner.
+    size = max(xy.max(), np.finfo(float).tiny)                                      # Size of the region.
+    q    = np.minimum(xy/size*(2**bits), 2**bits - 1).astype(np.uint64)             # Quantized coordinates.
+    for s, b in [(16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), \
+                 (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333), (1, 0x5555555555555555)]:
+        q = (q | (q << np.uint64(s))) & np.uint64(b)                                # The bits are spread.
+    key  = q[:,0] | (q[:,1] << np.uint64(1))                                        # The bits are interleaved.
+    return np.argsort(key, kind = 'stable')
+
+def Permutation(p, tt = None, order = 'rcm'):
+    """
+    Permutation
+    Function to select the ordering of the nodes of a cloud of points.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles (Default: None).
+        order                       string          Ordering to be used.
+                                                        'rcm': Reverse Cuthill-McKee (Default).
+                                                        'morton': Morton space-filling curve.
+
+    Output:
+        perm        m x 1           Array           New ordering of the nodes.
+        inv         m x 1           Array           Inverse of the new ordering.
+    """
+    if order == 'rcm':                                                              # For Reverse Cuthill-McKee.
+        perm = RCM(p, tt)
+    elif order == 'morton':                                                         # For the Morton curve.
+        perm = Morton(p)
+    else:                                                                           # For any other ordering.
+        raise ValueError('Unknown ordering: ' + str(order))
+    inv       = np.empty_like(perm)                                                 # inv initialization.
+    inv[perm] = np.arange(len(perm))                                                # Inverse of the new ordering.
+    return perm, inv
+
+def Permute(p, tt, perm, inv):
+    """
+    Permute
+    Function to reorder the nodes, boundary flags included, and the triangles of a cloud of points.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles (or None).
+        perm        m x 1           Array           New ordering of the nodes.
+        inv         m x 1           Array           Inverse of the new ordering.
+
+    Output:
+        p           m x 3           Array           Reordered nodes.
+        tt          n x 3           Array           Triangles with the new indices of the nodes (or None).
+    """
+    if tt is not None:                                                              # If there are triangles.
+        tt = inv[np.asarray(tt, dtype=int)]                                         # New indices of the nodes.
+    return p[perm], tt
+
+def Restore(vec, perm):
+    """
+    Restore
+    Function to return the neighbors of a reordered cloud of points to the original ordering of the nodes.
+
+    Input:
+        vec         m x nvec        Array           Neighbors of each node, in the new ordering.
+        perm        m x 1           Array           New ordering of the nodes.
+
+    Output:
+        vec         m x nvec        Array           Neighbors of each node, in the original ordering.
+    """
+    out       = np.empty_like(vec)                                                  # out initialization.
+    out[perm] = np.where(vec != -1, perm[vec], -1)                                  # Original indices of the nodes.
+    return out
+
+def Permute_Geometry(geometry, perm, inv):
+    """
+    Permute_Geometry
+    Function to reorder the neighbors and the Gammas of a cloud of points computed with the original ordering.
+
+    Input:
+        geometry                    tuple           Neighbors and Gammas (vec, K0) with the original ordering.
+        perm        m x 1           Array           New ordering of the nodes.
+        inv         m x 1           Array           Inverse of the new ordering.
+
+    Output:
+        geometry                    tuple           Neighbors and Gammas (vec, K0) with the new ordering.
+    """
+    vec, K0 = geometry                                                              # Neighbors and Gammas.
+    vec     = vec[perm]                                                             # Rows of the new ordering.
+    vec     = np.where(vec != -1, inv[vec], -1)                                     # New indices of the neighbors.
+    K0      = K0[perm][:, perm]                                                     # Rows and columns of the new ordering.
+    return vec, K0
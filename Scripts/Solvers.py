@@ -0,0 +1,144 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+def Pinv(A):
+    """
+    Pinv
+    Function to build the solver of a linear system through the pseudoinverse of the matrix.
+    The matrix is densified, so this solver is only suitable for small clouds.
+
+    Input:
+        A           m x m           Array           Matrix of the system (dense or sparse).
+
+    Output:
+        solve                       function        Function that receives the right-hand side b and returns A^+ b.
+                                                        An initial guess x0 can be given, but it is not used.
+    """
+    if sp.issparse(A):                                                              # If the matrix is sparse.
+        A = A.toarray()                                                             # The pseudoinverse requires a dense matrix.
+    Ai = np.linalg.pinv(A)                                                          # The pseudoinverse of the matrix.
+
+    def solve(b, x0 = None):
+        return Ai@b                                                                 # The solution is computed.
+    return solve
+
+def LU(A):
+    """
+    LU
+    Function to build the solver of a linear system through a sparse LU factorization of the matrix.
+    The factorization is computed only once, and each call only performs the triangular solves.
+
+    Input:
+        A           m x m           Array           Matrix of the system (dense or sparse).
+
+    Output:
+        solve                       function        Function that receives the right-hand side b and returns A^{-1} b.
+                                                        An initial guess x0 can be given, but it is not used.
+    """
+    A  = sp.csc_matrix(A)                                                           # The matrix is stored in CSC format.
+    LU = spla.splu(A)                                                               # Sparse LU factorization of the matrix.
+
+    def solve(b, x0 = None):
+        return LU.solve(np.asarray(b, dtype = A.dtype))                             # The triangular solves are performed.
+    return solve
+
+def Krylov(A, method = 'gmres', tol = 1e-10, maxiter = None, its = None):
+    """
+    Krylov
+    Function to build an iterative solver of a linear system for matrices too large to be factored.
+    The system is solved with GMRES or BiCGSTAB, preconditioned with an incomplete LU factorization computed only once.
+    Each call can be warm-started with an initial guess x0, and the number of iterations used is appended to its.
+    Several right-hand sides, stored as columns of b, are solved one after the other.
+
+    Input:
+        A           m x m           Array           Matrix of the system (dense or sparse).
+        method                      string          Krylov method to be used.
+                                                        'gmres': Restarted GMRES (Default).
+                                                        'bicgstab': BiCGSTAB.
+        tol                         float           Relative tolerance for the residual (Default: 1e-10). It is raised
+                                                    to 10 times the machine epsilon of A if it is smaller (about 1.2e-6
+                                                    for float32), since the residual can not be reduced further.
+        maxiter                     int             Maximum number of iterations (Default: None, SciPy default).
+        its                         list            List where the number of iterations of each solve is appended.
+
+    Output:
+        solve                       function        Function that receives the right-hand side b and, optionally, an
+                                                    initial guess x0, and returns the approximated solution.
+    """
+    A    = sp.csc_matrix(A)                                                         # The matrix is stored in CSC format.
+    tol  = max(tol, 10*np.finfo(A.dtype).eps)                                       # Tolerance reachable with the precision of A.
+    ILU  = spla.spilu(A)                                                            # Incomplete LU factorization of the matrix.
+    M    = spla.LinearOperator(A.shape, ILU.solve)                                  # The preconditioner as a linear operator.
+
+    def solve(b, x0 = None):
+        if np.ndim(b) == 2:                                                         # For several right-hand sides.
+            x = np.zeros(np.shape(b), dtype = A.dtype)                              # x initialization with zeros.
+            for e in np.arange(np.shape(b)[1]):                                     # For each right-hand side.
+                x[:,e] = solve(b[:,e], None if x0 is None else x0[:,e])             # The system is solved.
+            return x
+        b     = np.asarray(b, dtype = A.dtype)                                      # b with the precision of the matrix.
+        count = [0]                                                                 # Counter for the iterations.
+        def callback(xk):
+            count[0] += 1                                                           # An iteration has been performed.
+        if method == 'gmres':                                                       # For GMRES.
+            x, info = spla.gmres(A, b, x0 = x0, rtol = tol, maxiter = maxiter, M = M, \
+                                 callback = callback, callback_type = 'pr_norm')    # The system is solved.
+        elif method == 'bicgstab':                                                  # For BiCGSTAB.
+            x, info = spla.bicgstab(A, b, x0 = x0, rtol = tol, maxiter = maxiter, M = M, \
+                                    callback = callback)                            # The system is solved.
+        else:                                                                       # For any other method.
+            raise ValueError('Unknown Krylov method: ' + str(method))
+        if info > 0:                                                                # If the tolerance was not reached.
+            print('\tThe', method, 'solver did not converge after', count[0], 'iterations.')
+        if its is not None:                                                         # If the iterations are requested.
+            its.append(count[0])                                                    # The number of iterations is saved.
+        return x
+    return solve
+
+def Solver(A, solver = 'lu', tol = 1e-10, maxiter = None, its = None):
+    """
+    Solver
+    Function to select the solver for the linear systems of the implicit schemes.
+
+    Input:
+        A           m x m           Array           Matrix of the system (dense or sparse).
+        solver                      string          Solver to be used.
+                                                        'lu': Sparse LU factorization (Default).
+                                                        'pinv': Dense pseudoinverse.
+                                                        'gmres': ILU preconditioned GMRES.
+                                                        'bicgstab': ILU preconditioned BiCGSTAB.
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each solve is appended.
+
+    Output:
+        solve                       function        Function that receives the right-hand side b and, optionally, an
+                                                    initial guess x0, and returns the solution.
+    """
+    if solver == 'lu':                                                              # For the sparse LU factorization.
+        return LU(A)
+    elif solver == 'pinv':                                                          # For the dense pseudoinverse.
+        return Pinv(A)
+    elif solver in ('gmres', 'bicgstab'):                                           # For the iterative solvers.
+        return Krylov(A, solver, tol, maxiter, its)
+    else:                                                                           # For any other solver.
+        raise ValueError('Unknown solver: ' + str(solver))
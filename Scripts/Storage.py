@@ -0,0 +1,154 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import os
+import numpy as np
+import Scripts.Neighbors as Neighbors
+
+# Binary format of the clouds of points.
+# Each cloud is stored on a folder with the same name of its .mat file and one .npy file per field:
+#     p.npy       m x 3       float64     Coordinates of the nodes and the boundary flag.
+#     tt.npy      n x 3       int64       Triangles with 0-based indices (only for clouds with triangles).
+#     vec.npy     m x nvec    int64       Neighbors of each node (optional).
+# The files are memory-mapped when loaded, so they are read from drive only when used and shared between processes.
+# The neighbors are searched as Wave_2D.Geometry does (with the triangles when there are), so they can be given to
+# Wave_2D.Cloud to skip the neighbor search.
+
+def Save(folder, p, tt = None, vec = None):
+    """
+    Save
+    Function to store a cloud of points on the binary format.
+
+    Input:
+        folder                      string          Folder where the cloud is stored.
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles (Default: None).
+        vec         m x nvec        Array           Array with the neighbors of each node (Default: None).
+
+    Output:
+        None
+    """
+    os.makedirs(folder, exist_ok = True)                                            # The folder is created.
+    np.save(os.path.join(folder, 'p.npy'), np.ascontiguousarray(p, dtype = np.float64))
+    for name, data in [('tt', tt), ('vec', vec)]:                                   # For each integer field.
+        file = os.path.join(folder, name + '.npy')                                  # Name of the file.
+        if data is not None:                                                        # The field is stored.
+            np.save(file, np.ascontiguousarray(data, dtype = np.int64))
+        elif os.path.exists(file):                                                  # Old files are removed.
+            os.remove(file)
+
+def Load(folder, mmap = True):
+    """
+    Load
+    Function to load a cloud of points stored on the binary format.
+
+    Input:
+        folder                      string          Folder where the cloud is stored.
+        mmap                        bool            Memory-map the arrays instead of reading them (Default: True).
+
+    Output:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles (or None).
+        vec         m x nvec        Array           Array with the neighbors of each node (or None).
+    """
+    mode = 'r' if mmap else None                                                    # Read-only memory map.
+    out  = []
+    for name in ['p', 'tt', 'vec']:                                                 # For each field.
+        file = os.path.join(folder, name + '.npy')                                  # Name of the file.
+        out.append(np.load(file, mmap_mode = mode) if os.path.exists(file) else None)
+    if out[0] is None:                                                              # There is no cloud on the folder.
+        raise FileNotFoundError('No cloud stored on ' + folder)
+    return tuple(out)
+
+def Convert(file, vec = False, nvec = 8):
+    """
+    Convert
+    Function to convert a cloud of points from a .mat file to the binary format.
+    The cloud is stored on a folder with the name of the file without its extension.
+
+    Input:
+        file                        string          Name of the .mat file.
+        vec                         bool            Also store the neighbors of each node (Default: False).
+        nvec                        int             Maximum number of neighbors (Default: 8).
+
+    Output:
+        folder                      string          Folder where the cloud was stored.
+    """
+    from scipy.io import loadmat
+
+    mat = loadmat(file)                                                             # All data is loaded from the file.
+    p   = mat['p']                                                                  # Node data is saved.
+    tt  = mat.get('tt')                                                             # Triangle data is saved.
+    if tt is not None and tt.min() == 1:
+        tt = tt - 1
+    nei = None
+    if vec:                                                                         # The neighbors are computed.
+        if tt is not None:
+            nei = Neighbors.Triangulation(p, tt, nvec)
+        else:
+            nei = Neighbors.Cloud(p, nvec)
+    folder = os.path.splitext(file)[0]                                              # Folder of the cloud.
+    Save(folder, p, tt, nei)
+    return folder
+
+def Convert_All(root = 'Data', vec = False, nvec = 8):
+    """
+    Convert_All
+    Function to convert all the clouds of points on a folder, and its subfolders, to the binary format.
+
+    Input:
+        root                        string          Folder with the .mat files (Default: 'Data').
+        vec                         bool            Also store the neighbors of each node (Default: False).
+        nvec                        int             Maximum number of neighbors (Default: 8).
+
+    Output:
+        folders                     list            Folders where the clouds were stored.
+    """
+    folders = []
+    for path, _, files in sorted(os.walk(root)):                                    # For each folder.
+        for f in sorted(files):
+            if f.endswith('.mat'):                                                  # For each cloud.
+                folders.append(Convert(os.path.join(path, f), vec, nvec))
+    return folders
+
+def Read(file, mmap = True):
+    """
+    Read
+    Function to read a cloud of points from its binary format if it was converted, or from its .mat file if not.
+    The neighbors are returned only if they were stored on the binary format.
+
+    Input:
+        file                        string          Name of the .mat file.
+        mmap                        bool            Memory-map the arrays of the binary format (Default: True).
+
+    Output:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles, 0-based (or None).
+        vec         m x nvec        Array           Array with the neighbors of each node (or None).
+    """
+    folder = os.path.splitext(file)[0]                                              # Folder of the binary format.
+    if os.path.exists(os.path.join(folder, 'p.npy')):                               # If the cloud was converted.
+        return Load(folder, mmap)
+    from scipy.io import loadmat
+
+    mat = loadmat(file)                                                             # All data is loaded from the file.
+    p   = mat['p']                                                                  # Node data is saved.
+    tt  = mat.get('tt')                                                             # Triangle data is saved.
+    if tt is not None and tt.min() == 1:
+        tt -= 1
+    return p, tt, None
@@ -0,0 +1,52 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    November, 2022.
+
+Last Modification:
+    November, 2023.
+"""
+
+import os
+import sys
+import subprocess
+
+def Import_Time(code, repeat = 5):
+    """
+    Import_Time
+    Function to measure the time needed to run some imports on a new Python process.
+
+    Input:
+        code                        string          Imports to be measured.
+        repeat                      int             Number of new processes to be used (Default: 5).
+
+    Output:
+        time                        float           Minimum time, in seconds, over all the processes.
+    """
+    folder = os.path.dirname(os.path.abspath(__file__))                             # Folder of the repository.
+    bench  = 'import time\nt = time.perf_counter()\n' + code + '\nprint(time.perf_counter() - t)'
+    times  = []                                                                     # Time of each process.
+    for _ in range(repeat):                                                         # For each new process.
+        out = subprocess.run([sys.executable, '-c', bench], cwd = folder, capture_output = True, text = True, check = True)
+        times.append(float(out.stdout.split()[-1]))
+    return min(times)
+
+if __name__ == '__main__':
+    # Import time of the solvers, and of the plotting module before and after its libraries are needed.
+    cases = [('Wave_2D',                     'import Wave_2D'),
+             ('Gammas, Neighbors, Errors',   'import Scripts.Gammas, Scripts.Neighbors, Scripts.Errors'),
+             ('Example imports',             'import Scripts.Graph, Scripts.Errors, Wave_2D'),
+             ('Example imports + plotting',  'import Scripts.Graph, Scripts.Errors, Wave_2D\nScripts.Graph.Load()')]
+
+    print('%-30s %12s' %('imports', 'time [s]'))
+    for name, code in cases:
+        print('%-30s %12.4f' %(name, Import_Time(code)))
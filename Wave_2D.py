@@ -17,11 +17,495 @@ Last Modification:
 """
 
 import numpy as np
+import scipy.sparse as sp
 import Scripts.Gammas as Gammas
 import Scripts.Neighbors as Neighbors
+import Scripts.Solvers as Solvers
+import Scripts.Cache as Cache
+import Scripts.Errors as Errors
+import Scripts.Kernels as Kernels
+import Scripts.Reorder as Reorder
+import Scripts.Parallel as Parallel
 import time
+import warnings
 
-def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5):
+def Geometry(p, triangulation = False, tt = None, sparse = True, cache = None, vec = None):
+    '''
+    Geometry of the Meshless Generalized Finite Difference Scheme for the 2D wave equation.
+
+    This function performs the neighbor search and computes the Gammas of the Laplacian without the c^2 dt^2 factor.
+    Since the Gammas are linear in the differential operator, the K matrix of any time step is c^2 dt^2 K0, so the geometry
+    can be computed once per cloud and reused for any wave velocity and any time step. With a cache, the geometry is
+    stored on disk keyed only by the nodes, the triangles and the given neighbors, so it is shared by all the schemes run
+    on the same cloud.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        triangulation               bool            Select whether or not there is a triangulation available.
+                                                        True: Triangulation available.
+                                                        False: No triangulation available (Default)
+        tt          m x 3           ndarray         Array with the triangulation indexes.
+        sparse                      bool            Select whether or not K0 is stored as a sparse matrix (Default: True).
+        cache                       string          Folder of the on-disk cache for the neighbors and K0 (Default: None,
+                                                    no cache).
+        vec         m x o           ndarray         Neighbors of each node computed beforehand, for example stored with
+                                                    the cloud by Storage.Convert (Default: None, they are searched).
+
+    Output:
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+        K0          m x m           ndarray         K Matrix with the Gammas of the Laplacian (without c^2 dt^2).
+    '''
+    nvec = 8                                                                        # Maximum number of neighbors for each node.
+
+    # Geometry stored in the cache.
+    if cache is not None:                                                           # If the cache is used.
+        key     = Cache.Key(p, tt if triangulation else None, nvec, 'geometry', triangulation, vec = vec)
+        vec_c, K0 = Cache.Load(cache, key)                                          # Neighbors and K0 (K with c = dt = 1).
+        if vec_c is not None:                                                       # If the geometry was available.
+            return vec_c, (K0 if sparse == True else K0.toarray())
+
+    # Neighbor search for all the nodes.
+    if vec is not None:                                                             # If the neighbors were given.
+        vec = np.asarray(vec)                                                       # They are used as they are.
+    elif triangulation == True:                                                     # If there are triangles available.
+        vec = Neighbors.Triangulation(p, tt, nvec)                                  # Neighbor search with the proper routine.
+    else:                                                                           # If there are no triangles available.
+        vec = Neighbors.Cloud(p, nvec)                                              # Neighbor search with the proper routine.
+
+    # Computation of Gamma values
+    L  = np.vstack([[0], [0], [2], [0], [2]])                                       # The values of the differential operator are assigned.
+    K0 = Gammas.Cloud(p, vec, L, sparse)                                            # K0 computation with the required Gammas.
+    if cache is not None:                                                           # If the cache is used.
+        Cache.Save(cache, key, vec, K0)                                             # Neighbors and K0 are stored.
+    return vec, K0
+
+def Operators(p, t, c, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None, cache = None, geometry = None, dtype = np.float64):
+    '''
+    Operators of the Meshless Generalized Finite Difference Scheme for the 2D wave equation.
+
+    This function performs the neighbor search, computes the Gammas and assembles the operators used on each time step.
+    The first time level is computed as K1(K2 u_0 + dt g) and the following ones as K3(K4 u_{k-1} - u_{k-2}), where K1 and
+    K3 are solve functions and K2 and K4 are matrices. For the explicit scheme K1 and K3 return their argument, so each
+    time step is a single matrix-vector product.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        triangulation               bool            Select whether or not there is a triangulation available.
+                                                        True: Triangulation available.
+                                                        False: No triangulation available (Default)
+        tt          m x 3           ndarray         Array with the triangulation indexes.
+        implicit                    bool            Select whether or not use an implicit scheme.
+                                                        True: Implicit scheme used.
+                                                        False: Explicit scheme used (Default).
+        lam                         float           Lambda parameter for the implicit scheme.
+                                                        Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not the operators are stored as sparse matrices.
+                                                        True: Sparse CSR operators are used (Default).
+                                                        False: Dense operators are used.
+        solver                      string          Solver for the linear systems of the implicit scheme.
+                                                        'lu': Sparse LU factorization computed only once (Default).
+                                                        'pinv': Dense pseudoinverse.
+                                                        'gmres': ILU preconditioned GMRES with warm starts.
+                                                        'bicgstab': ILU preconditioned BiCGSTAB with warm starts.
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each time step is appended.
+        cache                       string          Folder of the on-disk cache for the neighbors and K0, keyed by the
+                                                    nodes and the triangles (Default: None, no cache). K0 does not
+                                                    depend on c, dt or lam, so it is shared by any scheme on the cloud.
+                                                    It is not read when geometry is given.
+        geometry                    tuple           Neighbors and Gammas (vec, K0) computed by Geometry, to be reused
+                                                    instead of being computed again (Default: None).
+        dtype                       dtype           Floating point type of the operators (Default: np.float64). The Gammas
+                                                    are computed and scaled in float64 and downcast afterward.
+
+    Output:
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+        K1                          function        Solve function for k = 1.
+        K2          m x m           ndarray         Matrix for k = 1.
+        K3                          function        Solve function for k = 2,...,t.
+        K4          m x m           ndarray         Matrix for k = 2,...,t.
+    '''
+    m      = len(p[:,0])                                                            # The total number of nodes is calculated.
+    T      = np.linspace(0,1,t)                                                     # Time discretization.
+    dt     = T[1] - T[0]                                                            # dt computation.
+    cdt    = (c**2)*(dt**2)                                                         # cdt is equals to c^2 dt^2.
+
+    if geometry is None:                                                            # If the geometry was not computed.
+        geometry = Geometry(p, triangulation, tt, sparse, cache)                    # Neighbor search and Gammas, or the cache.
+    vec, K = geometry[0], cdt*geometry[1]                                           # K is scaled with c^2 dt^2.
+
+    if sparse == False and sp.issparse(K):                                          # If a dense K is requested.
+        K = K.toarray()                                                             # K is converted to a dense matrix.
+    K = K.astype(dtype)                                                             # K is stored with the requested precision.
+    if sparse == True:                                                              # If sparse operators are requested.
+        I = sp.identity(m, dtype = dtype, format = 'csr')                           # Sparse identity matrix.
+    else:                                                                           # If dense operators are requested.
+        I = np.identity(m, dtype = dtype)                                           # Dense identity matrix.
+
+    if implicit == False:                                                           # For the explicit scheme.
+        K1 = K3 = lambda v, x0 = None: v                                            # No system has to be solved.
+        K2 = (I + (1/2)*K)                                                          # Explicit formulation of K for k = 1.
+        K4 = (2*I + K)                                                              # Explicit formulation of K for k = 2,...,t.
+    else:                                                                           # For the implicit scheme.
+        K1 = Solvers.Solver(I - (1-lam)*(1/2)*K, solver, tol, maxiter, its)         # Implicit formulation of K for k = 1.
+        K2 = (I + lam*(1/2)*K)                                                      # Implicit formulation of K for k = 1.
+        K3 = Solvers.Solver(I - (1-lam)*K, solver, tol, maxiter, its)               # Implicit formulation of K for k = 2,...,t.
+        K4 = (2*I + lam*K)                                                          # Implicit formulation of K for k = 2,...,t.
+
+    return vec, K1, K2, K3, K4
+
+def Spectral(K0, iters = 200, tol = 1e-4):
+    '''
+    Spectral radius of the Gammas of the Laplacian.
+
+    This function estimates the spectral radius of K0 with the power iteration, starting from a fixed random vector.
+
+    Input:
+        K0          m x m           ndarray         K Matrix with the Gammas of the Laplacian (dense or sparse).
+        iters                       int             Maximum number of iterations (Default: 200).
+        tol                         float           Relative tolerance for the estimate (Default: 1e-4).
+
+    Output:
+        rho                         float           Estimate of the spectral radius of K0.
+    '''
+    v   = np.random.default_rng(0).standard_normal(K0.shape[0])                     # Initial vector.
+    v   = v/np.linalg.norm(v)                                                       # The vector is normalized.
+    rho = 0                                                                         # rho initialization with zero.
+    for _ in range(iters):                                                          # For each iteration.
+        w    = K0@v                                                                 # The operator is applied.
+        rhon = np.linalg.norm(w)                                                    # New estimate of the spectral radius.
+        if rhon == 0:                                                               # If there are no inner nodes.
+            return 0.
+        v    = w/rhon                                                               # The vector is normalized.
+        if abs(rhon - rho) <= tol*rhon:                                             # If the estimate has converged.
+            return rhon
+        rho  = rhon                                                                 # The estimate is updated.
+    return rho
+
+def Stability(K):
+    '''
+    Stability check of the explicit scheme.
+
+    This function estimates the spectral radius of K = c^2 dt^2 K0 and warns when the explicit scheme is expected to be
+    unstable, that is, when c dt > 2/sqrt(rho(K0)) or, equivalently, rho(K) > 4. It is used by the routines that take
+    the requested time step as it is instead of sub-stepping it with Substeps.
+
+    Input:
+        K           m x m           ndarray         K Matrix with the Gammas scaled with c^2 dt^2 (dense or sparse).
+
+    Output:
+        stable                      bool            Whether or not the explicit scheme is expected to be stable.
+    '''
+    rho = Spectral(K)                                                               # Spectral radius of K.
+    if rho > 4:                                                                     # If the time step is too large.
+        warnings.warn('The explicit scheme is unstable for this time step (rho(c^2 dt^2 K0) = %1.3f > 4). ' %rho + \
+                      'Use more time steps, the implicit scheme, or Cloud, which sub-steps the explicit scheme.', RuntimeWarning)
+        return False
+    return True
+
+def Substeps(p, t, c, triangulation = False, tt = None, sparse = True, geometry = None, cfl = 'power', safety = 0.9, cache = None):
+    '''
+    Sub-stepping for the explicit scheme.
+
+    This function estimates the largest stable time step of the explicit scheme, c dt <= 2/sqrt(rho(K0)) with the spectral
+    radius of the Gammas ('power'), or c dt <= h/sqrt(2) with the minimum spacing h between neighbor nodes ('spacing'), and
+    computes the number of sub-steps needed between two of the t requested time levels to remain stable.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        triangulation               bool            Select whether or not there is a triangulation available.
+        tt          m x 3           ndarray         Array with the triangulation indexes.
+        sparse                      bool            Select whether or not K0 is stored as a sparse matrix (Default: True).
+        geometry                    tuple           Neighbors and Gammas (vec, K0) computed by Geometry (Default: None).
+        cfl                         string          Estimate of the stable time step.
+                                                        'power': Power iteration for the spectral radius of K0 (Default).
+                                                        'spacing': Minimum spacing between neighbor nodes.
+        safety                      float           Safety factor for the stable time step (Default: 0.9).
+        cache                       string          Folder of the on-disk cache for the neighbors and K0 (Default: None).
+
+    Output:
+        geometry                    tuple           Neighbors and Gammas (vec, K0), to be reused by Operators.
+        sub                         int             Number of sub-steps between two requested time levels.
+    '''
+    if geometry is None:                                                            # If the geometry was not computed.
+        geometry = Geometry(p, triangulation, tt, sparse, cache)                    # Neighbor search and Gammas, or the cache.
+    vec, K0 = geometry                                                              # Neighbors and Gammas.
+    if cfl == 'power':                                                              # For the spectral radius.
+        rho  = Spectral(K0)                                                         # Spectral radius of K0.
+        dtm  = np.inf if rho == 0 else 2/(c*np.sqrt(rho))                           # Largest stable time step.
+    elif cfl == 'spacing':                                                          # For the minimum spacing.
+        if vec is None:                                                             # If there are no neighbors.
+            raise ValueError('The spacing estimate needs the neighbors of the nodes.')
+        inne = p[:,2] == 0                                                          # Save the inner nodes.
+        neig = vec[inne,:]                                                          # Neighbors of the inner nodes.
+        d    = np.hypot(p[neig,0] - p[inne,0,np.newaxis], p[neig,1] - p[inne,1,np.newaxis])
+        dtm  = np.min(d[neig != -1], initial = np.inf)/(c*np.sqrt(2))               # Largest stable time step.
+    else:                                                                           # For any other estimate.
+        raise ValueError('Unknown time step estimate: ' + str(cfl))
+    dt  = 1/(t-1)                                                                   # Requested time step.
+    sub = max(1, int(np.ceil(dt/(safety*dtm))))                                     # Number of sub-steps.
+    return geometry, sub
+
+def Exact(p, f, T, c, cho, r, out = None, chunk = 64):
+    '''
+    Vectorized evaluation of a function of space and time over all the nodes and several time levels.
+
+    The function f is evaluated with broadcasting over a (nodes x times) grid, taking chunk time levels at once. If f can
+    not be broadcast, it is evaluated one time level at a time. It is used for the boundary conditions and for the
+    theoretical solution, which can be computed on demand with this function after the approximation.
+    The grid evaluation is only valid for functions that are elementwise in t, so each chunk is compared with the
+    evaluation of f on its first and last time levels; if they differ (for example, if f reduces over t or branches on
+    it), the remaining time levels are evaluated one at a time, as f(x, y, t) with the coordinates of all the nodes.
+    f is expected to be elementwise in x and y too, since it is also evaluated on subsets of the nodes (the boundary).
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes.
+        f                           function        Function to be evaluated.
+        T           t x 1           ndarray         Time levels where f is evaluated.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+        r           1 x 2           ndarray         Coordinates of the water drop-like function.
+        out         m x t           ndarray         Array where the values are stored (Default: None, a new array).
+        chunk                       int             Number of time levels evaluated at once (Default: 64).
+
+    Output:
+        out         m x t           ndarray         Array with the values of f.
+    '''
+    m = len(p[:,0])                                                                 # The total number of nodes is calculated.
+    T = np.atleast_1d(T)                                                            # Time levels as an array.
+    t = len(T)                                                                      # The number of time levels.
+    x = p[:,0,np.newaxis]                                                           # x coordinates as a column.
+    y = p[:,1,np.newaxis]                                                           # y coordinates as a column.
+    if out is None:                                                                 # If there is no array for the values.
+        out = np.zeros([m,t])                                                       # out initialization with zeros.
+
+    grid = True                                                                     # Whether f is evaluated on the grid.
+    for i in np.arange(0, t, chunk):                                                # For each chunk of time levels.
+        Ti = T[i:i+chunk]                                                           # Time levels of the chunk.
+        if grid == True:                                                            # f is evaluated on the whole grid.
+            try:
+                out[:, i:i+chunk] = np.broadcast_to(f(x, y, Ti[np.newaxis,:], c, cho, r), (m, len(Ti)))
+            except (ValueError, TypeError):                                         # If f can not be broadcast.
+                grid = False
+            if grid == True and len(Ti) > 1:                                        # The grid evaluation is checked.
+                for j in [0, len(Ti) - 1]:                                          # First and last time levels.
+                    u_j = np.broadcast_to(f(p[:,0], p[:,1], Ti[j], c, cho, r), (m,))
+                    if not np.allclose(out[:, i+j], u_j, rtol = 1e-10, atol = 1e-12):
+                        grid = False                                                # f is not elementwise in t.
+        if grid == False:                                                           # f is evaluated by time levels.
+            for j in np.arange(len(Ti)):                                            # For each time level of the chunk.
+                out[:, i+j] = f(p[:,0], p[:,1], Ti[j], c, cho, r)                   # f is evaluated on the time level.
+    return out
+
+def Stream(p, f, g, t, c, cho, r, K1, K2, K3, K4, steps = None, chunk = 64, dtype = np.float64):
+    '''
+    Time integration of the 2D wave equation keeping only two time levels.
+
+    This generator advances the solution with the operators computed by Operators, keeping in memory only the two previous
+    time levels, and yields each computed time level (or only the selected ones) as soon as it is available.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        f                           function        Function declared with the boundary condition.
+        g                           function        Function declared with the boundary condition.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+                                                        (0 for zero boundary condition)
+                                                        (1 for function boundary condition)
+        r           1 x 2           ndarray         Coordinates of the water drop-like function.
+        K1, K2, K3, K4                              Operators computed by Operators.
+        steps                       array           Time steps to be yielded (Default: None, all of them).
+        chunk                       int             Number of time levels of boundary conditions evaluated at once.
+        dtype                       dtype           Floating point type of the solution (Default: np.float64).
+
+    Output:
+        k                           int             Index of the time step.
+        T[k]                        float           Time of the time step.
+        u_k         m x 1           ndarray         Approximation computed on the time step.
+    '''
+    m      = len(p[:,0])                                                            # The total number of nodes is calculated.
+    T      = np.linspace(0,1,t)                                                     # Time discretization.
+    dt     = T[1] - T[0]                                                            # dt computation.
+    boun_n = (p[:, 2] == 1) | (p[:, 2] == 2)                                        # Save the boundary nodes.
+    inne_n = p[:,2] == 0                                                            # Save the inner nodes.
+    sel    = np.ones(t, dtype=bool)                                                 # Time steps to be yielded.
+    K2, K4 = Kernels.Operator(K2), Kernels.Operator(K4)                             # Accelerated products, if available.
+    if steps is not None:                                                           # If only some time steps are requested.
+        sel[:] = False                                                              # No time step is selected.
+        sel[np.asarray(steps, dtype=int)] = True                                    # The requested time steps are selected.
+
+    # Initial condition
+    u_k = np.zeros(m, dtype = dtype)                                                # u_k initialization with zeros.
+    u_k[:] = f(p[:, 0], p[:, 1], T[0], c, cho, r)                                   # The initial condition is assigned.
+    if sel[0]:                                                                      # If the time step is requested.
+        yield 0, T[0], u_k
+
+    # A Generalized Finite Differences Method
+    u_km = None                                                                     # Previous time level.
+    for k in range(1,t):                                                            # For al time levels.
+        if k == 1:                                                                  # For the first time level.
+            un = K1(K2@u_k + dt*g(p[:,0], p[:,1], T[k], c, cho, r), u_k)            # The new time-level is computed.
+        else:                                                                       # For all the other time levels.
+            un = K3(K4@u_k - u_km, 2*u_k - u_km)                                    # The new time-level is computed.
+        u_n = np.zeros(m, dtype = dtype)                                            # New time level initialization with zeros.
+        if cho == 1:                                                                # Approximation Type selection.
+            if (k-1) % chunk == 0:                                                  # If a new chunk of time levels starts.
+                u_b = Exact(p[boun_n,:], f, T[k:k+chunk], c, cho, r, chunk = chunk) # Boundary conditions of the chunk.
+            u_n[boun_n] = u_b[:, (k-1) % chunk]                                     # The boundary condition is assigned.
+        u_n[inne_n] = un[inne_n]                                                    # Save the computed solution.
+        u_km, u_k   = u_k, u_n                                                      # Only two time levels are kept.
+        if sel[k]:                                                                  # If the time step is requested.
+            yield k, T[k], u_k
+
+def Cloud_Stream(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None, steps = None, cache = None, geometry = None, cfl = 'power', dtype = np.float64, order = None, workers = None, vec = None):
+    '''
+    Streaming numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
+
+    This generator works as Cloud, but instead of storing the full history of the solution it keeps only two time levels and
+    yields each time level (or only the selected ones), so the results can be sent to disk, to error accumulators or to
+    renderers with constant memory.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        f                           function        Function declared with the boundary condition.
+        g                           function        Function declared with the boundary condition.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+                                                        (0 for zero boundary condition)
+                                                        (1 for function boundary condition)
+        r           1 x 2           ndarray         Coordinates of the water drop-like function.
+        triangulation               bool            Select whether or not there is a triangulation available.
+                                                        True: Triangulation available.
+                                                        False: No triangulation available (Default)
+        tt          m x 3           ndarray         Array with the triangulation indexes.
+        implicit                    bool            Select whether or not use an implicit scheme.
+                                                        True: Implicit scheme used.
+                                                        False: Explicit scheme used (Default).
+        lam                         float           Lambda parameter for the implicit scheme.
+                                                        Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not the operators are stored as sparse matrices.
+                                                        True: Sparse CSR operators are used (Default).
+                                                        False: Dense operators are used.
+        solver                      string          Solver for the linear systems of the implicit scheme.
+                                                        'lu': Sparse LU factorization computed only once (Default).
+                                                        'pinv': Dense pseudoinverse.
+                                                        'gmres': ILU preconditioned GMRES with warm starts.
+                                                        'bicgstab': ILU preconditioned BiCGSTAB with warm starts.
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each time step is appended.
+        cache                       string          Folder of the on-disk cache for the neighbors and K0, keyed by the
+                                                    nodes and the triangles (Default: None, no cache). It is shared by
+                                                    Substeps and Operators, and it is not read when geometry is given.
+        geometry                    tuple           Neighbors and Gammas (vec, K0) computed by Geometry, to be reused
+                                                    instead of being computed again (Default: None).
+        steps                       array           Time steps to be yielded (Default: None, all of them).
+        cfl                         string          Estimate of the stable time step of the explicit scheme (see Substeps).
+                                                    Each requested time step is divided into as many sub-steps as
+                                                    needed to remain stable (Default: 'power'). With None, no sub-steps
+                                                    are used.
+        dtype                       dtype           Floating point type of the operators and the solution (Default:
+                                                    np.float64). np.float32 halves the memory traffic and the storage.
+        order                       string          Reordering of the nodes before the assembly (Default: None).
+                                                        'rcm': Reverse Cuthill-McKee.
+                                                        'morton': Morton space-filling curve.
+                                                    The neighbors are searched with the original ordering, and the
+                                                    results are returned in it.
+        workers                     int             Number of worker processes of the domain decomposition (Default:
+                                                    None, a single process; see Cloud).
+        vec         m x o           ndarray         Neighbors of each node computed beforehand, for example loaded with
+                                                    Storage.Read, so the neighbor search is skipped (Default: None).
+
+    Output:
+        k                           int             Index of the time step.
+        T[k]                        float           Time of the time step.
+        u_k         m x 1           ndarray         Approximation computed on the time step.
+    '''
+    steps  = np.arange(t) if steps is None else np.unique(np.asarray(steps, dtype=int)) # Sorted time steps.
+    stream = Integrator(p, f, g, t, c, cho, r, triangulation, tt, implicit, lam, sparse, solver, tol, maxiter, its, steps, cache, geometry, cfl, dtype, order, workers, vec)[0]
+    for j, T_k, u_k in stream:                                                      # For each requested time step.
+        yield int(steps[j]), T_k, u_k
+
+def History(path, m, s, dtype = np.float64):
+    '''
+    Storage for the history of a solution.
+
+    This function allocates the array where s time levels of a solution on m nodes are stored. If a path is given, the
+    array is a .npy file opened as a memory map with a time-major layout (one row per time level), so histories larger
+    than the physical memory can be written, and later read by slices with np.load(path, mmap_mode = 'r').
+
+    Input:
+        path                        string          Path of the .npy file (None to keep the array in memory).
+        m                           int             Number of nodes.
+        s                           int             Number of time levels.
+        dtype                       dtype           Floating point type of the array (Default: np.float64).
+
+    Output:
+        u           m x s           ndarray         Array initialized with zeros (a transposed view of the file if path is given).
+    '''
+    if path is None:                                                                # If the history is kept in memory.
+        return np.zeros([m,s], dtype = dtype)                                       # Array initialization with zeros.
+    u = np.lib.format.open_memmap(path, mode = 'w+', dtype = dtype, shape = (s, m)) # Time-major memory-mapped file.
+    return u.T                                                                      # Node-major view of the file.
+
+def Integrator(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None, steps = None, cache = None, geometry = None, cfl = 'power', dtype = np.float64, order = None, workers = None, vec = None):
+    '''
+    Time integrator shared by Cloud, Cloud_Errors and Cloud_Stream.
+
+    This function prepares the geometry, the reordering, the sub-steps and the operators (or the domain decomposition) of
+    the scheme, and returns a generator of the requested time levels in the original ordering of the nodes. The inputs
+    are those of Cloud; steps are the requested time levels (Default: None, all of them).
+
+    Output:
+        stream                      generator       Generator of (j, T[k], u_k) for the j-th requested time level k.
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+    '''
+    steps  = np.arange(t) if steps is None else np.asarray(steps, dtype=int)       # Time levels to be computed.
+    if geometry is None and vec is not None:                                        # If the neighbors were given.
+        geometry = Geometry(p, triangulation, tt, sparse, cache, vec)               # Only the Gammas are computed.
+
+    # Reordering of the nodes
+    q, qt  = p, tt                                                                  # Nodes used by the scheme.
+    if order is not None:                                                           # If the nodes are reordered.
+        perm, inv = Reorder.Permutation(p, tt if triangulation else None, order)    # New ordering of the nodes.
+        q, qt     = Reorder.Permute(p, tt if triangulation else None, perm, inv)    # Nodes and triangles are reordered.
+        if geometry is None:                                                        # If the geometry was not computed.
+            geometry = Geometry(p, triangulation, tt, sparse, cache)                # Same neighbors for any ordering.
+        geometry = Reorder.Permute_Geometry(geometry, perm, inv)                    # The geometry is reordered.
+
+    # Sub-steps of the explicit scheme
+    sub    = 1                                                                      # Sub-steps per requested time step.
+    if implicit == False and cfl is not None:                                       # For the explicit scheme.
+        geometry, sub = Substeps(q, t, c, triangulation, qt, sparse, geometry, cfl, cache = cache)
+        if sub > 1:                                                                 # If sub-steps are needed.
+            print('\tThe explicit scheme uses', sub, 'sub-steps per time step.')
+
+    # Operators of the scheme
+    if workers is None or workers <= 1:                                             # For a single process.
+        vec, K1, K2, K3, K4 = Operators(q, (t-1)*sub + 1, c, triangulation, qt, implicit, lam, sparse, solver, tol, maxiter, its, cache, geometry, dtype)
+        stream = Stream(q, f, g, (t-1)*sub + 1, c, cho, r, K1, K2, K3, K4, steps*sub, dtype = dtype)
+    else:                                                                           # For the domain decomposition.
+        if geometry is None:                                                        # If the geometry was not computed.
+            geometry = Geometry(q, triangulation, qt, True, cache)                  # Neighbor search and Gammas, or the cache.
+        vec    = geometry[0]                                                        # Neighbors of each node.
+        stream = Parallel.Stream(q, f, g, (t-1)*sub + 1, c, cho, r, geometry, implicit, lam, workers, steps*sub, tol, maxiter, its)
+    if order is not None:                                                           # If the nodes were reordered.
+        vec = Reorder.Restore(vec, perm)                                            # Neighbors in the original ordering.
+
+    def ordered():
+        for j, (k, T_k, u_k) in enumerate(stream):                                  # For each requested time level.
+            yield j, T_k, (u_k[inv] if order is not None else u_k)                  # Solution in the original ordering.
+
+    return ordered(), vec
+
+def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None, path = None, path_ex = None, stride = 1, exact = True, cache = None, geometry = None, cfl = 'power', dtype = np.float64, order = None, workers = None, vec = None):
     '''
     Numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
     
@@ -51,71 +535,357 @@ def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = Fa
                                                         False: Explicit scheme used (Default).
         lam                         float           Lambda parameter for the implicit scheme.
                                                         Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not the operators are stored as sparse matrices.
+                                                        True: Sparse CSR operators are used (Default).
+                                                        False: Dense operators are used.
+        solver                      string          Solver for the linear systems of the implicit scheme.
+                                                        'lu': Sparse LU factorization computed only once (Default).
+                                                        'pinv': Dense pseudoinverse.
+                                                        'gmres': ILU preconditioned GMRES with warm starts.
+                                                        'bicgstab': ILU preconditioned BiCGSTAB with warm starts.
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each time step is appended.
+        cache                       string          Folder of the on-disk cache for the neighbors and K0, keyed by the
+                                                    nodes and the triangles (Default: None, no cache). It is shared by
+                                                    Substeps and Operators, and it is not read when geometry is given.
+        geometry                    tuple           Neighbors and Gammas (vec, K0) computed by Geometry, to be reused
+                                                    instead of being computed again (Default: None).
+        path                        string          Path of the .npy file where u_ap is written as a memory-mapped array
+                                                    with one row per stored time level (Default: None, kept in memory).
+        path_ex                     string          Path of the .npy file where u_ex is written in the same way
+                                                    (Default: None, kept in memory).
+        stride                      int             Only every stride-th time level is stored (Default: 1).
+        exact                       bool            Select whether or not the theoretical solution is computed.
+                                                        True: u_ex is computed (Default).
+                                                        False: u_ex is skipped and None is returned; it can be
+                                                        computed later on demand with Exact.
+        cfl                         string          Estimate of the stable time step of the explicit scheme (see Substeps).
+                                                    Each requested time step is divided into as many sub-steps as
+                                                    needed to remain stable (Default: 'power'). With None, no sub-steps
+                                                    are used.
+        dtype                       dtype           Floating point type of the operators and the solution (Default:
+                                                    np.float64). np.float32 halves the memory traffic and the storage.
+        order                       string          Reordering of the nodes before the assembly (Default: None).
+                                                        'rcm': Reverse Cuthill-McKee.
+                                                        'morton': Morton space-filling curve.
+                                                    The neighbors are searched with the original ordering, and the
+                                                    results (and vec) are returned in it.
+        workers                     int             Number of worker processes of the domain decomposition (Default:
+                                                    None, a single process). The nodes are split into compact
+                                                    partitions, each worker owns the rows of K of one of them, and the
+                                                    halo values are exchanged through shared memory (see
+                                                    Parallel.Stream). The implicit scheme uses block-Jacobi iterations
+                                                    with tolerance tol, and the computations are made in float64.
+        vec         m x o           ndarray         Neighbors of each node computed beforehand, for example loaded with
+                                                    Storage.Read, so the neighbor search is skipped (Default: None).
     
     Output:
-        u_ap        m x t           ndarray         Array with the approximation computed by the routine.
-        u_ex        m x t           ndarray         Array with the theoretical solution.
+        u_ap        m x s           ndarray         Array with the approximation computed by the routine on the s stored
+                                                    time levels (a transposed view of the memory-mapped file if path is given).
+        u_ex        m x s           ndarray         Array with the theoretical solution (None if exact is False).
         vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.  
     '''
     m      = len(p[:,0])                                                            # The total number of nodes is calculated.
-    nvec   = 8                                                                      # Maximum number of neighbors for each node.
     T      = np.linspace(0,1,t)                                                     # Time discretization.
-    dt     = T[1] - T[0]                                                            # dt computation.
-    u_ap   = np.zeros([m,t])                                                        # u_ap initialization with zeros.
-    u_ex   = np.zeros([m,t])                                                        # u_ex initialization with zeros.
-    cdt    = (c**2)*(dt**2)                                                         # cdt is equals to c^2 dt^2.
+    steps  = np.arange(0, t, stride)                                                # Time levels to be stored.
+
+    # Operators of the scheme
+    stream, vec = Integrator(p, f, g, t, c, cho, r, triangulation, tt, implicit, lam, sparse, solver, tol, maxiter, its, steps, cache, geometry, cfl, dtype, order, workers, vec)
+    u_ap   = History(path, m, len(steps), dtype)                                    # u_ap initialization with zeros.
+    
+    start = time.time()
+
+    # A Generalized Finite Differences Method
+    for j, T_k, u_k in stream:                                                      # For each stored time level.
+        u_ap[:,j] = u_k                                                             # Save the computed solution.
+    
+    end = time.time()
+
+    print('\tThe elapsed time of the method was: ', end-start, 'seconds.')
+    if implicit == True and its:                                                    # If the iterations were recorded.
+        print('\tThe mean number of iterations per time step was: ', np.mean(its))
+
+    # Theoretical Solution
+    u_ex = None                                                                     # The theoretical solution is not computed.
+    if exact == True:                                                               # If the theoretical solution is requested.
+        u_ex = History(path_ex, m, len(steps), dtype)                               # u_ex initialization with zeros.
+        u_ex = Exact(p, f, T[steps], c, cho, r, out = u_ex)                         # The theoretical solution is computed.
+
+    if path is not None:                                                            # If u_ap is stored on disk.
+        u_ap.flush()                                                                # All the time levels are written.
+    if path_ex is not None and exact == True:                                       # If u_ex is stored on disk.
+        u_ex.flush()                                                                # All the time levels are written.
+
+    return u_ap, u_ex, vec
+
+def Cloud_Errors(p, f, g, t, c, cho, r, errors = 'cloud', triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None, stride = 1, cache = None, geometry = None, cfl = 'power', dtype = np.float64, order = None, workers = None, vec = None):
+    '''
+    Errors of the numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
+
+    This function works as Cloud, but instead of storing the histories of the approximation and of the theoretical solution,
+    the theoretical solution is evaluated only for the current time level and the errors are accumulated while stepping,
+    so the memory used does not grow with the number of time steps.
+
+    Input:
+        The inputs are those of Cloud (path, path_ex and exact are not needed), and:
+        errors                      string/list     Error reducer(s) evaluated while stepping (Default: 'cloud').
+                                                        'cloud': Area-weighted quadratic mean error.
+                                                        'size': Size-weighted quadratic mean error.
+                                                        'max': Maximum absolute error.
+                                                    Functions reduce(u_ap, u_ex) can also be given (see Errors.Reducer).
+
+    Output:
+        er          s x n           ndarray         Error of each of the n reducers on the s time levels (s x 1 if
+                                                    errors is a single reducer).
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+    '''
+    steps  = np.arange(0, t, stride)                                                # Time levels to be evaluated.
+
+    # Operators of the scheme
+    stream, vec = Integrator(p, f, g, t, c, cho, r, triangulation, tt, implicit, lam, sparse, solver, tol, maxiter, its, steps, cache, geometry, cfl, dtype, order, workers, vec)
+    single = isinstance(errors, str) or callable(errors)                            # Whether a single reducer is given.
+    reds   = [Errors.Reducer(e, p, vec) for e in ([errors] if single else errors)]  # Reducers of the errors.
+    er     = np.zeros([len(steps), len(reds)])                                      # er initialization with zeros.
+
+    start = time.time()
+
+    # A Generalized Finite Differences Method
+    for j, T_k, u_k in stream:                                                      # For each evaluated time level.
+        u_e = Exact(p, f, np.array([T_k]), c, cho, r)[:,0]                          # Theoretical solution of the time level.
+        er[j,:] = [reduce(u_k, u_e) for reduce in reds]                             # The errors are accumulated.
+
+    end = time.time()
+
+    print('\tThe elapsed time of the method was: ', end-start, 'seconds.')
+    if implicit == True and its:                                                    # If the iterations were recorded.
+        print('\tThe mean number of iterations per time step was: ', np.mean(its))
+
+    return (er[:,0] if single else er), vec
+
+def Cloud_Ensemble(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None, exact = True, cache = None, geometry = None, cfl = 'power', dtype = np.float64):
+    '''
+    Numerical solution of an ensemble of 2D wave equations on irregular domains using a Meshless Generalized Finite Difference Scheme.
+
+    This function advances E problems on the same cloud of points at the same time, sharing the neighbor search, the Gammas
+    and the operators. The state is an m x E array, so each time step is a single sparse matrix times a dense block product
+    and a single solve with E right-hand sides. The members are given by lists of functions f and g and/or by an E x 2 array
+    of coordinates r; any of them given only once is shared by all the members.
+    Only the 'lu' solver solves the E right-hand sides as one block. Solvers.Krylov ('gmres' and 'bicgstab') solves the E
+    columns one after the other, so Krylov ensembles share the operators but get no batching speedup in the solves; its
+    receives the iterations of each column, and the mean reported is per member and time step.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        f                           function/list   Function(s) declared with the boundary condition.
+        g                           function/list   Function(s) declared with the boundary condition.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+                                                        (0 for zero boundary condition)
+                                                        (1 for function boundary condition)
+        r           E x 2           ndarray         Coordinates of the water drop-like function of each member.
+        triangulation               bool            Select whether or not there is a triangulation available.
+                                                        True: Triangulation available.
+                                                        False: No triangulation available (Default)
+        tt          m x 3           ndarray         Array with the triangulation indexes.
+        implicit                    bool            Select whether or not use an implicit scheme.
+                                                        True: Implicit scheme used.
+                                                        False: Explicit scheme used (Default).
+        lam                         float           Lambda parameter for the implicit scheme.
+                                                        Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not the operators are stored as sparse matrices.
+                                                        True: Sparse CSR operators are used (Default).
+                                                        False: Dense operators are used.
+        solver                      string          Solver for the linear systems of the implicit scheme.
+                                                        'lu': Sparse LU factorization computed only once (Default).
+                                                        'pinv': Dense pseudoinverse.
+                                                        'gmres': ILU preconditioned GMRES with warm starts.
+                                                        'bicgstab': ILU preconditioned BiCGSTAB with warm starts.
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each time step is appended.
+        exact                       bool            Select whether or not the theoretical solutions are computed.
+                                                        True: u_ex is computed (Default).
+                                                        False: u_ex is skipped and None is returned.
+        cache                       string          Folder of the on-disk cache for the neighbors and K0, keyed by the
+                                                    nodes and the triangles (Default: None, no cache). It is shared by
+                                                    Substeps and Operators, and it is not read when geometry is given.
+        geometry                    tuple           Neighbors and Gammas (vec, K0) computed by Geometry, to be reused
+                                                    instead of being computed again (Default: None).
+        cfl                         string          Estimate of the stable time step of the explicit scheme (see Substeps).
+                                                    Each requested time step is divided into as many sub-steps as
+                                                    needed to remain stable (Default: 'power'). With None, no sub-steps
+                                                    are used.
+        dtype                       dtype           Floating point type of the operators and the solution (Default:
+                                                    np.float64). np.float32 halves the memory traffic and the storage.
+
+    Output:
+        u_ap        m x t x E       ndarray         Array with the approximation of each member.
+        u_ex        m x t x E       ndarray         Array with the theoretical solution of each member.
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+    '''
+    m      = len(p[:,0])                                                            # The total number of nodes is calculated.
+    T      = np.linspace(0,1,t)                                                     # Time discretization.
     boun_n = (p[:, 2] == 1) | (p[:, 2] == 2)                                        # Save the boundary nodes.
     inne_n = p[:,2] == 0                                                            # Save the inner nodes.
+    chunk  = 64                                                                     # Time levels of boundary conditions at once.
 
-    # Boundary conditions
-    if cho == 1:                                                                    # Approximation Type selection.
-        for k in np.arange(t):                                                      # For each time step.
-            u_ap[boun_n, k] = f(p[boun_n, 0], p[boun_n, 1], T[k], c, cho, r)        # The boundary condition is assigned.
+    # Members of the ensemble
+    r = np.asarray(r, dtype=float)                                                  # Coordinates of the drops as an array.
+    E = max(len(f) if isinstance(f, (list, tuple)) else 1, \
+            len(g) if isinstance(g, (list, tuple)) else 1, \
+            len(r) if r.ndim == 2 else 1)                                           # The number of members.
+    f = list(f) if isinstance(f, (list, tuple)) else [f]*E                          # A function f for each member.
+    g = list(g) if isinstance(g, (list, tuple)) else [g]*E                          # A function g for each member.
+    r = r if r.ndim == 2 else np.tile(r, (E, 1))                                    # Coordinates of the drop of each member.
+    u_ap = np.zeros([t, m, E], dtype = dtype)                                       # u_ap initialization with zeros.
+
+    # Sub-steps of the explicit scheme
+    sub    = 1                                                                      # Sub-steps per requested time step.
+    if implicit == False and cfl is not None:                                       # For the explicit scheme.
+        geometry, sub = Substeps(p, t, c, triangulation, tt, sparse, geometry, cfl, cache = cache)
+        if sub > 1:                                                                 # If sub-steps are needed.
+            print('\tThe explicit scheme uses', sub, 'sub-steps per time step.')
+    s      = (t-1)*sub + 1                                                          # The number of internal time levels.
+    Ts     = np.linspace(0,1,s)                                                     # Internal time discretization.
+    dt     = Ts[1] - Ts[0]                                                          # dt computation.
+
+    # Operators of the scheme
+    vec, K1, K2, K3, K4 = Operators(p, s, c, triangulation, tt, implicit, lam, sparse, solver, tol, maxiter, its, cache, geometry, dtype)
+    K2, K4 = Kernels.Operator(K2), Kernels.Operator(K4)                             # Accelerated products, if available.
+
+    start = time.time()
 
     # Initial condition
-    u_ap[:, 0] = f(p[:, 0], p[:, 1], T[0], c, cho, r)                               # The initial condition is assigned.
-    
-    # Neighbor search for all the nodes.
-    if triangulation == True:                                                       # If there are triangles available.
-        vec = Neighbors.Triangulation(p, tt, nvec)                                  # Neighbor search with the proper routine.
-    else:                                                                           # If there are no triangles available.
-        vec = Neighbors.Cloud(p, nvec)                                              # Neighbor search with the proper routine.
+    for e in np.arange(E):                                                          # For each member.
+        u_ap[0, :, e] = f[e](p[:, 0], p[:, 1], T[0], c, cho, r[e])                  # The initial condition is assigned.
+    u_0, u_1 = None, u_ap[0]                                                        # The last two internal time levels.
 
-     # Computation of Gamma values
-    L = np.vstack([[0], [0], [2*cdt], [0], [2*cdt]])                                # The values of the differential operator are assigned.
-    K = Gammas.Cloud(p, vec, L)                                                     # K computation with the required Gammas.
+    # A Generalized Finite Differences Method
+    for k in np.arange(1,s):                                                        # For al internal time levels.
+        if k == 1:                                                                  # For the first time level.
+            G  = np.zeros([m, E])                                                   # G initialization with zeros.
+            for e in np.arange(E):                                                  # For each member.
+                G[:,e] = g[e](p[:,0], p[:,1], Ts[k], c, cho, r[e])                  # The initial velocity is assigned.
+            un = K1(K2@u_1 + dt*G, u_1)                                             # The new time-level is computed.
+        else:                                                                       # For all the other time levels.
+            un = K3(K4@u_1 - u_0, 2*u_1 - u_0)                                      # The new time-level is computed.
+        u_k = np.zeros([m, E], dtype = dtype)                                       # u_k initialization with zeros.
+        if cho == 1:                                                                # Approximation Type selection.
+            if (k-1) % chunk == 0:                                                  # If a new chunk of time levels starts.
+                u_b = [Exact(p[boun_n,:], f[e], Ts[k:k+chunk], c, cho, r[e], chunk = chunk) for e in np.arange(E)]
+            for e in np.arange(E):                                                  # For each member.
+                u_k[boun_n, e] = u_b[e][:, (k-1) % chunk]                           # The boundary condition is assigned.
+        u_k[inne_n, :] = un[inne_n, :]                                              # Save the computed solution.
+        u_0, u_1 = u_1, u_k                                                         # The time levels are shifted.
+        if k % sub == 0:                                                            # If it is a requested time level.
+            u_ap[k//sub] = u_k                                                      # Save the computed solution.
+
+    end = time.time()
+
+    print('\tThe elapsed time of the method was: ', end-start, 'seconds.')
+    if implicit == True and its:                                                    # If the iterations were recorded.
+        print('\tThe mean number of iterations per time step was: ', np.mean(its))
+
+    # Theoretical Solution
+    u_ex = None                                                                     # The theoretical solution is not computed.
+    if exact == True:                                                               # If the theoretical solution is requested.
+        u_ex = np.zeros([m, t, E], dtype = dtype)                                   # u_ex initialization with zeros.
+        for e in np.arange(E):                                                      # For each member.
+            u_ex[:,:,e] = Exact(p, f[e], T, c, cho, r[e])                           # The theoretical solution is computed.
+
+    return np.moveaxis(u_ap, 0, 1), u_ex, vec
+
+def Mesh(x, y, f, g, t, c, cho, r, implicit = False, lam = 0.5, solver = 'lu', tol = 1e-10, maxiter = None, its = None, cfl = 'power', dtype = np.float64):
+    '''
+    Numerical solution of the 2D wave equation on logically rectangular meshes using a Generalized Finite Difference Scheme.
 
+    This function works as Cloud, but the neighbors of each node are the 8 immediate neighbors of the mesh, so no neighbor
+    search is needed. The Gammas are computed at once as an m x n x 9 array with Gammas.Mesh_Gammas and K is assembled in
+    DIAgonal format, so each matrix-vector product is a set of strided updates over the whole mesh.
+
+    Input:
+        x           m x n           ndarray         Array with the coordinates in x of the nodes.
+        y           m x n           ndarray         Array with the coordinates in y of the nodes.
+        f                           function        Function declared with the boundary condition.
+        g                           function        Function declared with the boundary condition.
+        t                           int             Number of time steps to be considered.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+                                                        (0 for zero boundary condition)
+                                                        (1 for function boundary condition)
+        r           1 x 2           ndarray         Coordinates of the water drop-like function.
+        implicit                    bool            Select whether or not use an implicit scheme.
+                                                        True: Implicit scheme used.
+                                                        False: Explicit scheme used (Default).
+        lam                         float           Lambda parameter for the implicit scheme.
+                                                        Must be between 0 and 1 (Default: 0.5).
+        solver                      string          Solver for the linear systems of the implicit scheme (see Cloud).
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each time step is appended.
+        cfl                         string          Estimate of the stable time step of the explicit scheme.
+                                                        'power': Each requested time step is divided into as many
+                                                        sub-steps as needed to remain stable (Default).
+                                                        None: No sub-steps are used.
+        dtype                       dtype           Floating point type of the operators and the solution (Default:
+                                                    np.float64). np.float32 halves the memory traffic and the storage.
+
+    Output:
+        u_ap        m x n x t       ndarray         Array with the approximation computed by the routine.
+        u_ex        m x n x t       ndarray         Array with the theoretical solution.
+    '''
+    m      = len(x[:,0])                                                            # The number of nodes in x.
+    n      = len(x[0,:])                                                            # The number of nodes in y.
+    N      = m*n                                                                    # The total number of nodes.
+    T      = np.linspace(0,1,t)                                                     # Time discretization.
+
+    # Nodes of the mesh, with the node (i, j) in the position m*j + i.
+    b      = np.ones([m,n])                                                         # Flag for the boundary nodes.
+    b[1:-1,1:-1] = 0                                                                # Flag for the inner nodes.
+    p      = np.column_stack([x.ravel(order = 'F'), y.ravel(order = 'F'), b.ravel(order = 'F')])
+
+    # Operators of the scheme
+    L      = np.vstack([[0], [0], [2], [0], [2]])                                   # The values of the differential operator are assigned.
+    K0     = Gammas.Mesh(x, y, L, sparse = True)                                    # K0 computation with the required Gammas.
+    sub    = 1                                                                      # Sub-steps per requested time step.
+    if implicit == False and cfl is not None:                                       # For the explicit scheme.
+        _, sub = Substeps(p, t, c, geometry = (None, K0), cfl = cfl)                # Number of stable sub-steps.
+        if sub > 1:                                                                 # If sub-steps are needed.
+            print('\tThe explicit scheme uses', sub, 'sub-steps per time step.')
+    s      = (t-1)*sub + 1                                                          # The number of internal time levels.
+    dt     = 1/(s-1)                                                                # dt computation.
+    cdt    = (c**2)*(dt**2)                                                         # cdt is equals to c^2 dt^2.
+    K      = (cdt*K0).astype(dtype)                                                 # K is scaled with c^2 dt^2.
+    I      = sp.identity(N, dtype = dtype, format = 'dia')                          # Sparse identity matrix.
     if implicit == False:                                                           # For the explicit scheme.
-        K1 = (np.identity(m) + (1/2)*K)                                             # Explicit formulation of K for k = 1.
-        K2 = (2*np.identity(m) + K)                                                 # Explicit formulation of K for k = 2,...,t.
+        K1 = K3 = lambda v, x0 = None: v                                            # No system has to be solved.
+        K2 = (I + (1/2)*K)                                                          # Explicit formulation of K for k = 1.
+        K4 = (2*I + K)                                                              # Explicit formulation of K for k = 2,...,t.
     else:                                                                           # For the implicit scheme.
-        K1 = np.linalg.pinv(np.identity(m) - (1-lam)*(1/2)*K)                       # Implicit formulation of K for k = 1.
-        K2 = (np.identity(m) + lam*(1/2)*K)                                         # Implicit formulation of K for k = 1.
-        K3 = np.linalg.pinv(np.identity(m) - (1-lam)*K)                             # Implicit formulation of K for k = 2,...,t.
-        K4 = (2*np.identity(m) + lam*K)                                             # Implicit formulation of K for k = 2,...,t.
-    
+        K1 = Solvers.Solver(I - (1-lam)*(1/2)*K, solver, tol, maxiter, its)         # Implicit formulation of K for k = 1.
+        K2 = (I + lam*(1/2)*K)                                                      # Implicit formulation of K for k = 1.
+        K3 = Solvers.Solver(I - (1-lam)*K, solver, tol, maxiter, its)               # Implicit formulation of K for k = 2,...,t.
+        K4 = (2*I + lam*K)                                                          # Implicit formulation of K for k = 2,...,t.
+
     start = time.time()
 
     # A Generalized Finite Differences Method
-    ## Second time step computation.
-    for k in np.arange(1,t):                                                        # For al time levels.
-        if k == 1:                                                                  # For the first time level.
-            un = K1@(K2@u_ap[:,k-1] + dt*g(p[:,0], p[:,1], T[k], c, cho, r))        # The new time-level is computed.
-            u_ap[inne_n, k] = un[inne_n]                                            # Save the computed solution.
-        else:                                                                       # For all the other time levels.
-            un = K3@(K4@u_ap[:,k-1] - u_ap[:,k-2])                                  # The new time-level is computed.
-            u_ap[inne_n,k] = un[inne_n]                                             # Save the computed solution.                
-    
+    u_ap = np.zeros([m, n, t], dtype = dtype)                                       # u_ap initialization with zeros.
+    for k, _, u_k in Stream(p, f, g, s, c, cho, r, K1, K2, K3, K4, np.arange(t)*sub, dtype = dtype):
+        u_ap[:,:,k//sub] = u_k.reshape(m, n, order = 'F')                           # Save the computed solution.
+
     end = time.time()
 
     print('\tThe elapsed time of the method was: ', end-start, 'seconds.')
+
     # Theoretical Solution
-    for k in np.arange(t):                                                          # For all the time steps.
-        u_ex[:,k] = f(p[:,0], p[:,1], T[k], c, cho, r)                              # The theoretical solution is computed.
+    u_ex = Exact(p, f, T, c, cho, r).reshape(m, n, t, order = 'F')                  # The theoretical solution is computed.
 
-    return u_ap, u_ex, vec
+    return u_ap, u_ex
 
-def Cloud_old(p, f, g, t, c, cho, r, triangulation = False, tt = [], implicit = False, lam = 0.5):
+def Cloud_old(p, f, g, t, c, cho, r, triangulation = False, tt = [], implicit = False, lam = 0.5, sparse = True, solver = 'lu'):
     '''
     (Outdated working version)
     Numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
@@ -146,6 +916,12 @@ def Cloud_old(p, f, g, t, c, cho, r, triangulation = False, tt = [], implicit =
                                                         False: Explicit scheme used (Default).
         lam                         float           Lambda parameter for the implicit scheme.
                                                         Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not the operators are stored as sparse matrices.
+                                                        True: Sparse CSR operators are used (Default).
+                                                        False: Dense operators are used.
+        solver                      string          Solver for the linear systems of the implicit scheme.
+                                                        'lu': Sparse LU factorization computed only once (Default).
+                                                        'pinv': Dense pseudoinverse.
     
     Output:
         u_ap        m x t           ndarray         Array with the approximation computed by the routine.
@@ -181,29 +957,35 @@ def Cloud_old(p, f, g, t, c, cho, r, triangulation = False, tt = [], implicit =
 
      # Computation of Gamma values
     L = np.vstack([[0], [0], [2*cdt], [0], [2*cdt]])                                # The values of the differential operator are assigned.
-    K = Gammas.Cloud(p, vec, L)                                                     # K computation with the required Gammas.
+    K = Gammas.Cloud(p, vec, L, sparse)                                             # K computation with the required Gammas.
+    if sparse == True:                                                              # If sparse operators are requested.
+        I = sp.identity(m, format = 'csr')                                          # Sparse identity matrix.
+    else:                                                                           # If dense operators are requested.
+        I = np.identity(m)                                                          # Dense identity matrix.
     if implicit == False:                                                           # For the explicit scheme.
-        K1 = (np.identity(m) + (1/2)*K)                                             # Explicit formulation of K for k = 1.
-        K2 = (2*np.identity(m) + K)                                                 # Explicit formulation of K for k = 2,...,t.
+        Stability(K)                                                                # Warning if dt is not stable.
+        K1 = K3 = lambda v, x0 = None: v                                            # No system has to be solved.
+        K2 = (I + (1/2)*K)                                                          # Explicit formulation of K for k = 1.
+        K4 = (2*I + K)                                                              # Explicit formulation of K for k = 2,...,t.
     else:                                                                           # For the implicit scheme.
-        K1 = np.linalg.pinv(np.identity(m) - (1-lam)*(1/2)*K)                       # Implicit formulation of K for k = 1.
-        K2 = (np.identity(m) + lam*(1/2)*K)                                         # Implicit formulation of K for k = 1.
-        K3 = np.linalg.pinv(np.identity(m) - (1-lam)*K)                             # Implicit formulation of K for k = 2,...,t.
-        K4 = (2*np.identity(m) + lam*K)                                             # Implicit formulation of K for k = 2,...,t.
+        K1 = Solvers.Solver(I - (1-lam)*(1/2)*K, solver)                            # Implicit formulation of K for k = 1.
+        K2 = (I + lam*(1/2)*K)                                                      # Implicit formulation of K for k = 1.
+        K3 = Solvers.Solver(I - (1-lam)*K, solver)                                  # Implicit formulation of K for k = 2,...,t.
+        K4 = (2*I + lam*K)                                                          # Implicit formulation of K for k = 2,...,t.
     
     start = time.time()
 
     # A Generalized Finite Differences Method
     ## Second time step computation.
     for k in np.arange(1,2):                                                        # For k = 1.
-        un = K1@(K2@u_ap[:,k-1] + dt*g(p[:,0], p[:,1], T[k], c, cho, r))            # The new time-level is computed.
+        un = K1(K2@u_ap[:,k-1] + dt*g(p[:,0], p[:,1], T[k], c, cho, r))             # The new time-level is computed.
         for i in np.arange(m):                                                      # For all the nodes.
             if p[i,2] == 0:                                                         # If the node is an inner node.
                 u_ap[i,k] = un[i]                                                   # Save the computed solution.
     
     ## Other time steps computation.
     for k in np.arange(2,t):                                                        # For all the other time steps.
-        un = K3@(K4@u_ap[:,k-1] - u_ap[:,k-2])                                      # The new time-level is computed.
+        un = K3(K4@u_ap[:,k-1] - u_ap[:,k-2])                                       # The new time-level is computed.
         for i in np.arange(m):                                                      # For all the nodes.
             if p[i,2] == 0:                                                         # If the node is an inner node.
                 u_ap[i,k] = un[i]                                                   # Save the computed solution.
@@ -218,7 +1000,7 @@ def Cloud_old(p, f, g, t, c, cho, r, triangulation = False, tt = [], implicit =
 
     return u_ap, u_ex, vec
 
-def Cloud_Neumann(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5):
+def Cloud_Neumann(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = True, solver = 'lu', tol = 1e-10, maxiter = None, its = None):
     '''
     Numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
     
@@ -248,6 +1030,17 @@ def Cloud_Neumann(p, f, g, t, c, cho, r, triangulation = False, tt = None, impli
                                                         False: Explicit scheme used (Default).
         lam                         float           Lambda parameter for the implicit scheme.
                                                         Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not the operators are stored as sparse matrices.
+                                                        True: Sparse CSR operators are used (Default).
+                                                        False: Dense operators are used.
+        solver                      string          Solver for the linear systems of the implicit scheme.
+                                                        'lu': Sparse LU factorization computed only once (Default).
+                                                        'pinv': Dense pseudoinverse.
+                                                        'gmres': ILU preconditioned GMRES with warm starts.
+                                                        'bicgstab': ILU preconditioned BiCGSTAB with warm starts.
+        tol                         float           Relative tolerance for the iterative solvers (Default: 1e-10).
+        maxiter                     int             Maximum number of iterations for the iterative solvers.
+        its                         list            List where the number of iterations of each time step is appended.
     
     Output:
         u_ap        m x t           ndarray         Array with the approximation computed by the routine.
@@ -281,16 +1074,22 @@ def Cloud_Neumann(p, f, g, t, c, cho, r, triangulation = False, tt = None, impli
 
      # Computation of Gamma values
     L = np.vstack([[0], [0], [2*cdt], [0], [2*cdt]])                                # The values of the differential operator are assigned.
-    K = Gammas.Cloud(p, vec, L)                                                     # K computation with the required Gammas.
+    K = Gammas.Cloud(p, vec, L, sparse)                                             # K computation with the required Gammas.
+    if sparse == True:                                                              # If sparse operators are requested.
+        I = sp.identity(m, format = 'csr')                                          # Sparse identity matrix.
+    else:                                                                           # If dense operators are requested.
+        I = np.identity(m)                                                          # Dense identity matrix.
 
     if implicit == False:                                                           # For the explicit scheme.
-        K1 = (np.identity(m) + (1/2)*K)                                             # Explicit formulation of K for k = 1.
-        K2 = (2*np.identity(m) + K)                                                 # Explicit formulation of K for k = 2,...,t.
+        Stability(K)                                                                # Warning if dt is not stable.
+        K1 = K3 = lambda v, x0 = None: v                                            # No system has to be solved.
+        K2 = (I + (1/2)*K)                                                          # Explicit formulation of K for k = 1.
+        K4 = (2*I + K)                                                              # Explicit formulation of K for k = 2,...,t.
     else:                                                                           # For the implicit scheme.
-        K1 = np.linalg.pinv(np.identity(m) - (1-lam)*(1/2)*K)                       # Implicit formulation of K for k = 1.
-        K2 = (np.identity(m) + lam*(1/2)*K)                                         # Implicit formulation of K for k = 1.
-        K3 = np.linalg.pinv(np.identity(m) - (1-lam)*K)                             # Implicit formulation of K for k = 2,...,t.
-        K4 = (2*np.identity(m) + lam*K)                                             # Implicit formulation of K for k = 2,...,t.
+        K1 = Solvers.Solver(I - (1-lam)*(1/2)*K, solver, tol, maxiter, its)         # Implicit formulation of K for k = 1.
+        K2 = (I + lam*(1/2)*K)                                                      # Implicit formulation of K for k = 1.
+        K3 = Solvers.Solver(I - (1-lam)*K, solver, tol, maxiter, its)               # Implicit formulation of K for k = 2,...,t.
+        K4 = (2*I + lam*K)                                                          # Implicit formulation of K for k = 2,...,t.
     
     start = time.time()
 
@@ -298,15 +1097,18 @@ def Cloud_Neumann(p, f, g, t, c, cho, r, triangulation = False, tt = None, impli
     ## Second time step computation.
     for k in np.arange(1,t):                                                        # For al time levels.
         if k == 1:                                                                  # For the first time level.
-            un = K1@(K2@u_ap[:,k-1] + dt*g(p[:,0], p[:,1], T[k], c, cho, r))        # The new time-level is computed.
+            un = K1(K2@u_ap[:,k-1] + dt*g(p[:,0], p[:,1], T[k], c, cho, r), \
+                    u_ap[:,k-1])                                                    # The new time-level is computed.
             u_ap[inne_n, k] = un[inne_n]                                            # Save the computed solution.
         else:                                                                       # For all the other time levels.
-            un = K3@(K4@u_ap[:,k-1] - u_ap[:,k-2])                                  # The new time-level is computed.
+            un = K3(K4@u_ap[:,k-1] - u_ap[:,k-2], 2*u_ap[:,k-1] - u_ap[:,k-2])      # The new time-level is computed.
             u_ap[inne_n,k] = un[inne_n]                                             # Save the computed solution.                
     
     end = time.time()
 
     print('\tThe elapsed time of the method was: ', end-start, 'seconds.')
+    if implicit == True and its:                                                    # If the iterations were recorded.
+        print('\tThe mean number of iterations per time step was: ', np.mean(its))
     # Theoretical Solution
     for k in np.arange(t):                                                          # For all the time steps.
         u_ex[:,k] = f(p[:,0], p[:,1], T[k], c, cho, r)                              # The theoretical solution is computed.